@@ -34,13 +34,17 @@ import argparse
 import json
 import shutil
 import tempfile
+from functools import lru_cache
+from itertools import islice
+
+import jsonschema
 
 from tests._fixture_builders import build_minimal_verify_fixture
 from renderer.preview_local import PreviewRenderer
 from schemas.asset_manifest import AssetManifest, Shot, VisualAsset, VOLine
 from schemas.render_plan import RenderPlan, Resolution
 from schemas.render_output import RenderAudit
-from verify_contracts import check_schema
+from verify_contracts import SCHEMA_MAP
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -78,16 +82,57 @@ _MIN_REAL_ASSET_BYTES = 100
 # (used by cmd_render here and imported by scripts/render_from_orchestrator.py)
 # =============================================================================
 
+# Contract errors reported per document; validation stops after these.
+_MAX_CONTRACT_ERRORS = 3
+
+
+@lru_cache(maxsize=len(SCHEMA_MAP))
+def _compile_contract(schema_path: Path, mtime_ns: int) -> jsonschema.Draft7Validator:
+    # mtime_ns is only part of the cache key: an edited schema file recompiles.
+    return jsonschema.Draft7Validator(json.loads(schema_path.read_bytes()))
+
+
+def contract_validator(
+    schema_id: str, schemas_dir: Path = _CONTRACTS_SCHEMAS_DIR
+) -> jsonschema.Draft7Validator | None:
+    """Compiled Draft7Validator for *schema_id*'s contract schema.
+
+    Returns None when schema_id has no SCHEMA_MAP entry.  Each schema file is
+    compiled once per version (path + mtime); the vendored
+    verify_contracts.check_schema() recompiles on every call instead.
+
+    Raises OSError / ValueError if the mapped schema file cannot be read or
+    parsed.
+    """
+    schema_file = SCHEMA_MAP.get(Path(schema_id).stem)
+    if schema_file is None:
+        return None
+    schema_path = schemas_dir / schema_file
+    return _compile_contract(schema_path, schema_path.stat().st_mtime_ns)
+
+
 def _validate_contract(data: dict, label: str) -> None:
     """Validate *data* against its contract JSON schema (keyed by schema_id).
 
-    Exits with code 1 on validation failure.  Silently passes when schema_id is
-    absent — unknown/internal formats are not penalised.
+    Exits with code 1 on validation failure, listing the first
+    _MAX_CONTRACT_ERRORS jsonschema messages (not verify_contracts'
+    SCHEMA_INVALID lines).  Silently passes when schema_id is absent or has no
+    contract schema — unknown/internal formats are not penalised.
     """
     schema_id = data.get("schema_id")
     if not schema_id:
         return
-    errors = check_schema(data, schema_id, _CONTRACTS_SCHEMAS_DIR)
+    try:
+        validator = contract_validator(schema_id)
+    except (OSError, ValueError) as exc:
+        errors = [f"schema unavailable: {exc}"]
+    else:
+        if validator is None:
+            return
+        errors = [
+            e.message
+            for e in islice(validator.iter_errors(data), _MAX_CONTRACT_ERRORS)
+        ]
     if errors:
         print(
             f"Contract validation FAILED for {label} (schema_id={schema_id!r}):",
@@ -418,7 +463,7 @@ def cmd_render(
             # contract requires strings (no partial-output contract exists yet).
             if not dry_run:
                 _validate_contract(
-                    json.loads(result.model_dump_json()),
+                    result.model_dump(mode="json"),
                     "render output",
                 )
 
@@ -589,7 +634,8 @@ def cmd_verify(strict: bool = False, profile: str = "preview") -> int:
 # CLI entry point
 # =============================================================================
 
-def main() -> None:
+def main(argv: list[str] | None = None) -> None:
+    """CLI entry point.  *argv* defaults to sys.argv[1:]; tests pass it in-process."""
     parser = argparse.ArgumentParser(
         prog="video",
         description="video — deterministic preview renderer CLI",
@@ -651,7 +697,7 @@ def main() -> None:
         help="Compare dry-run outputs only (faster; no ffmpeg call)",
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     if args.command == "render":
         sys.exit(cmd_render(
@@ -35,6 +35,7 @@ def generate_placeholder(
     font_size: int = 36,
     output_path: Optional[Path] = None,
     cache_dir: Optional[Path] = None,
+    compress_level: int = 9,
 ) -> Path:
     """
     Generate a placeholder PNG for a missing or unresolved visual asset.
@@ -56,6 +57,8 @@ def generate_placeholder(
         font_size:   Font point size (approximate for built-in font fallback).
         output_path: Explicit output path.  If None, a cached path in *cache_dir* is used.
         cache_dir:   Directory for cached placeholders.  Required if *output_path* is None.
+        compress_level: PNG zlib level (0-9).  Changes file bytes, never decoded
+                     pixels; keep the default wherever PNG bytes are hashed.
 
     Returns:
         Path to the generated (or cached) PNG file.
@@ -128,8 +131,8 @@ def generate_placeholder(
     draw.text((x, y), text, fill=text_color, font=font, align="center")
 
     # --- Save PNG ---
-    # compress_level=9 with optimize=False is deterministic for the same Pillow version.
-    img.save(str(output_path), format="PNG", compress_level=9, optimize=False)
+    # A fixed compress_level with optimize=False is deterministic for the same Pillow version.
+    img.save(str(output_path), format="PNG", compress_level=compress_level, optimize=False)
     logger.debug("Generated placeholder: %s (%dx%d)", output_path, width, height)
     return output_path
 
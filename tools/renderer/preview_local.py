@@ -24,7 +24,6 @@ from __future__ import annotations
 
 import datetime
 import hashlib
-import json
 import logging
 import subprocess
 from pathlib import Path
@@ -32,6 +31,7 @@ from typing import Optional
 from urllib.parse import urlparse
 
 from schemas.asset_manifest import AssetManifest, Shot
+from schemas.base import canonical_json_bytes
 from schemas.render_plan import RenderPlan
 from schemas.render_output import (
     EffectiveSettings,
@@ -113,10 +113,11 @@ class PreviewRenderer:
         self._asset_manifest_ref = asset_manifest_ref
         self.dry_run = dry_run
 
-        # Pre-compute canonical lineage hashes once; reused by render() to
-        # avoid double-serialisation and to derive stable IDs.
-        self._manifest_hash = _canonical_json_hash(self.manifest.model_dump())
-        self._plan_hash = _canonical_json_hash(self.plan.model_dump())
+        # Canonical lineage hashes are cached on the (frozen) input models, so
+        # repeated renderers over the same inputs — e.g. verify()'s dry-run
+        # pass — serialise each model only once.
+        self._manifest_hash = self.manifest.canonical_sha256
+        self._plan_hash = self.plan.canonical_sha256
         # Stable render/request identity derived from inputs, not a random UUID.
         self._derived_id = hashlib.sha256(
             f"{self._manifest_hash}:{self._plan_hash}".encode("utf-8")
@@ -367,16 +368,14 @@ class PreviewRenderer:
     def _compute_inputs_digest(self, effective: EffectiveSettings) -> str:
         """SHA-256 over canonical JSON of plan + manifest + effective_settings.
 
-        Same canonicalisation as _canonical_json_hash(): sorted keys, compact
-        separators, UTF-8.  Order is fixed: plan → manifest → effective_settings.
+        Each part is schemas.base.canonical_json_bytes() output.  Order is
+        fixed: plan → manifest → effective_settings.
+        Plan and manifest bytes come from their cached canonical_json.
         """
         h = hashlib.sha256()
-        for obj in (self.plan, self.manifest, effective):
-            blob = json.dumps(
-                obj.model_dump(), sort_keys=True,
-                separators=(",", ":"), ensure_ascii=False,
-            )
-            h.update(blob.encode("utf-8"))
+        h.update(self.plan.canonical_json)
+        h.update(self.manifest.canonical_json)
+        h.update(canonical_json_bytes(effective.model_dump()))
         return h.hexdigest()
 
     # ------------------------------------------------------------------
@@ -571,16 +570,12 @@ def _canonical_json_hash(obj: dict) -> str:
     order or serialisation library internals (e.g. model_dump_json() key order
     is not guaranteed to be stable across Pydantic versions).
     """
-    canonical = json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
-    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    return hashlib.sha256(canonical_json_bytes(obj)).hexdigest()
 
 
 def _sha256_file(path: Path) -> str:
-    h = hashlib.sha256()
     with open(path, "rb") as fh:
-        for chunk in iter(lambda: fh.read(65_536), b""):
-            h.update(chunk)
-    return h.hexdigest()
+        return hashlib.file_digest(fh, "sha256").hexdigest()
 
 
 def _sha256_text(text: str) -> str:
@@ -15,7 +15,9 @@ from __future__ import annotations
 
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from schemas.base import HashableModel
 
 
 class VOLine(BaseModel):
@@ -23,6 +25,8 @@ class VOLine(BaseModel):
     Voice-over line item. Field names are canonical (§5.7).
     speaker_id, text, emotion, pacing_tags are explicit in the spec.
     """
+    model_config = ConfigDict(frozen=True)
+
     line_id: str
     speaker_id: str
     text: str
@@ -41,6 +45,8 @@ class VisualAsset(BaseModel):
     role values: "background" | "character" | "prop"  (§5.7: character packs, backgrounds, props)
     asset_uri is null when the asset has not been resolved; renderer generates a placeholder.
     """
+    model_config = ConfigDict(frozen=True)
+
     asset_id: str
     role: str = "background"
     asset_uri: Optional[str] = None          # file:// URI or null
@@ -50,6 +56,8 @@ class VisualAsset(BaseModel):
 
 class SFXItem(BaseModel):
     """Sound effect requirement for a shot (§5.7: SFX/music needs)."""
+    model_config = ConfigDict(frozen=True)
+
     sfx_id: str
     description: str
     audio_uri: Optional[str] = None
@@ -62,6 +70,8 @@ class Shot(BaseModel):
     duration_ms is inherited from the ShotList timing lock and must not be altered
     after the timing_lock_hash is produced.
     """
+    model_config = ConfigDict(frozen=True)
+
     shot_id: str
     duration_ms: int                             # locked from ShotList §5.6
     visual_assets: list[VisualAsset] = Field(default_factory=list)
@@ -70,7 +80,7 @@ class Shot(BaseModel):
     music_mood: str = ""
 
 
-class AssetManifest(BaseModel):
+class AssetManifest(HashableModel):
     """
     AssetManifest — maps ShotList requirements to asset slots.
     Canonical schema §5.7. Consumer: RenderPlan builder (resolves URIs),
@@ -80,6 +90,8 @@ class AssetManifest(BaseModel):
     the value in the corresponding RenderPlan exactly; any mismatch causes
     the renderer to abort (§10.1 deterministic requirement).
     """
+    model_config = ConfigDict(frozen=True)
+
     schema_version: str = "1.0.0"
     manifest_id: str
     project_id: str
@@ -0,0 +1,57 @@
+"""
+Shared base for canonical pipeline schemas.
+
+HashableModel adds memoised canonical JSON bytes and their SHA-256 to input
+artifacts (AssetManifest, RenderPlan) so lineage hashes (§5.9, §14) and the
+inputs_digest are serialised once per instance instead of on every
+RenderOutput build.
+
+Canonical form (canonical_json_bytes): JSON with sorted keys, compact
+separators, ensure_ascii=False, UTF-8.  This is the only definition of it;
+renderer.preview_local hashes plain dicts through the same function, so model
+and dict lineage hashes cannot drift apart.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Mapping
+from functools import cached_property
+from typing import Any, Optional
+
+from pydantic import BaseModel
+from typing_extensions import Self
+
+
+def canonical_json_bytes(obj: Any) -> bytes:
+    """Canonical JSON encoding of obj (a model_dump() dict or plain JSON data)."""
+    return json.dumps(
+        obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    ).encode("utf-8")
+
+
+class HashableModel(BaseModel):
+    """
+    BaseModel with cached canonical_json / canonical_sha256.
+
+    Subclasses must be frozen: the cache is never invalidated on assignment.
+    model_copy() drops the cached values since update= may change fields.
+    """
+
+    @cached_property
+    def canonical_json(self) -> bytes:
+        """canonical_json_bytes(self.model_dump())."""
+        return canonical_json_bytes(self.model_dump())
+
+    @cached_property
+    def canonical_sha256(self) -> str:
+        """SHA-256 hex digest of canonical_json."""
+        return hashlib.sha256(self.canonical_json).hexdigest()
+
+    def model_copy(
+        self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False
+    ) -> Self:
+        copied = super().model_copy(update=update, deep=deep)
+        copied.__dict__.pop("canonical_json", None)
+        copied.__dict__.pop("canonical_sha256", None)
+        return copied
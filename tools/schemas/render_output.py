@@ -15,11 +15,13 @@ from __future__ import annotations
 
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class OutputHashes(BaseModel):
     """Content hashes for output artifacts (§5.9: hashes)."""
+    model_config = ConfigDict(frozen=True)
+
     video_sha256: str
     captions_sha256: Optional[str] = None
     audio_stems_sha256: Optional[str] = None   # always null in Phase 0
@@ -31,6 +33,8 @@ class Provenance(BaseModel):
     rendered_at: ISO 8601 wall-clock timestamp (not used for determinism checks;
     the timing_lock_hash + lineage hashes are the reproducibility anchors).
     """
+    model_config = ConfigDict(frozen=True)
+
     render_profile: str
     timing_lock_hash: str
     rendered_at: str            # ISO 8601
@@ -44,12 +48,16 @@ class Lineage(BaseModel):
     Input artifact hashes for full reproducibility (§5.9: lineage references, §14).
     Enables the artifact registry to reconstruct any render from stored inputs.
     """
+    model_config = ConfigDict(frozen=True)
+
     asset_manifest_hash: str    # SHA-256 of the input AssetManifest JSON
     render_plan_hash: str       # SHA-256 of the input RenderPlan JSON
 
 
 class OutputArtifact(BaseModel):
     """One produced output file with its content hash."""
+    model_config = ConfigDict(frozen=True)
+
     type: str      # "video" | "captions"
     path: str      # absolute filesystem path
     sha256: str    # hex SHA-256 of file contents
@@ -57,6 +65,8 @@ class OutputArtifact(BaseModel):
 
 class EffectiveSettings(BaseModel):
     """Render settings snapshot — enables determinism proofs."""
+    model_config = ConfigDict(frozen=True)
+
     resolution: str   # e.g. "1280x720"
     fps: str          # e.g. "24"
     audio_rate: str   # codec name or "none"  (Phase-0: "aac" or "none")
@@ -68,12 +78,16 @@ class EffectiveSettings(BaseModel):
 
 class Producer(BaseModel):
     """Identifies the software that produced this RenderOutput."""
+    model_config = ConfigDict(frozen=True)
+
     name: str = "PreviewRenderer"
     version: str = "0.0.1"
 
 
 class RenderFingerprint(BaseModel):
     """Deterministic render fingerprint — no wall-clock timestamps."""
+    model_config = ConfigDict(frozen=True)
+
     inputs_digest: str            # SHA-256 of canonical plan+manifest+effective_settings
     mp4_sha256: str               # SHA-256 of output.mp4 bytes
     srt_sha256: str               # SHA-256 of output.srt text (UTF-8); "" if no VO
@@ -85,6 +99,8 @@ class RenderOutput(BaseModel):
     RenderOutput — result of one renderer invocation.
     Canonical schema §5.9. Written to render_output.json alongside the .mp4 and .srt.
     """
+    model_config = ConfigDict(frozen=True)
+
     schema_version: str = "0.0.1"
     schema_id: str = "RenderOutput"
     output_id: str
@@ -105,5 +121,7 @@ class RenderOutput(BaseModel):
 
 class RenderAudit(BaseModel):
     """Result of one audit-render invocation."""
+    model_config = ConfigDict(frozen=True)
+
     status: str                # "pass" | "fail"
     diff_fields: list[str] = []  # field paths that differed between the two runs
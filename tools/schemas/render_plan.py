@@ -15,11 +15,15 @@ from __future__ import annotations
 
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from schemas.base import HashableModel
 
 
 class Resolution(BaseModel):
     """Output resolution. Canonical field names: width, height, aspect."""
+    model_config = ConfigDict(frozen=True)
+
     width: int = 1280
     height: int = 720
     aspect: str = "16:9"
@@ -31,12 +35,14 @@ class FallbackConfig(BaseModel):
     placeholder_font_path: absolute path to a .ttf font on the render host.
     Default points to DejaVuSans on Ubuntu; override for other environments.
     """
+    model_config = ConfigDict(frozen=True)
+
     placeholder_color: str = "#1a1a2e"
     placeholder_font_path: str = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
     placeholder_font_size: int = 36
 
 
-class RenderPlan(BaseModel):
+class RenderPlan(HashableModel):
     """
     RenderPlan — resolves AssetManifest to render-ready inputs with profile.
     Canonical schema §5.8.
@@ -48,6 +54,8 @@ class RenderPlan(BaseModel):
     timing_lock_hash MUST equal AssetManifest.timing_lock_hash; the renderer
     validates this at startup and aborts if they differ.
     """
+    model_config = ConfigDict(frozen=True)
+
     schema_version: str = "1.0.0"
     plan_id: str
     project_id: str
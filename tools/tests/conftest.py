@@ -4,22 +4,20 @@ Shared pytest fixtures for video/tools/tests/.
 Provides:
   - deterministic test PNG assets (generated with Pillow, not committed binaries)
   - pre-built AssetManifest and RenderPlan objects for the 5-shot golden fixture
+  - verify_fixture: the minimal dry-m / dry-pl (manifest, plan) per plan profile
   - require_ffmpeg: skip-marker for tests that need the ffmpeg binary
+  - require_pil: skip-marker for tests that need Pillow (full renders)
 """
 from __future__ import annotations
 
-import subprocess
+import importlib.util
 from pathlib import Path
 from typing import Iterator
 
 import pytest
 
-# ---- optional Pillow import ----
-try:
-    from PIL import Image
-    _PIL_AVAILABLE = True
-except ImportError:
-    _PIL_AVAILABLE = False
+# ---- optional Pillow (imported lazily inside test_assets_dir) ----
+_PIL_AVAILABLE = importlib.util.find_spec("PIL") is not None
 
 
 # ---------------------------------------------------------------------------
@@ -40,6 +38,13 @@ _ASSET_SHOT_DURATION_MS = 2_000   # 2 s per shot
 _W, _H = 1280, 720
 _FPS = 24
 
+# Field values repeated across every shot / VO line; one shared str object each.
+_NARRATOR = "narrator"
+_NEUTRAL = "neutral"
+_BG = "background"
+_PROFILE = "preview_local"
+_FONT = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+
 
 # ---------------------------------------------------------------------------
 # Test-asset generation (deterministic with Pillow)
@@ -57,11 +62,13 @@ def test_assets_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
     if not _PIL_AVAILABLE:
         pytest.skip("Pillow not installed; cannot generate test assets.")
 
+    from PIL import Image
+
     assets_dir = tmp_path_factory.mktemp("assets", numbered=False)
     for name, color in _ASSET_COLORS.items():
+        path = assets_dir / f"{name}.png"
         img = Image.new("RGB", (_W, _H), color=color)
-        img.save(str(assets_dir / f"{name}.png"), format="PNG",
-                 compress_level=9, optimize=False)
+        img.save(str(path), format="PNG", compress_level=9, optimize=False)
     return assets_dir
 
 
@@ -97,16 +104,16 @@ def build_manifest(assets_dir: Path):
             visual_assets=[
                 VisualAsset(
                     asset_id="bg_001",
-                    role="background",
+                    role=_BG,
                     asset_uri=img_uri("shot_001"),
                 )
             ],
             vo_lines=[
                 VOLine(
                     line_id="vo_001",
-                    speaker_id="narrator",
+                    speaker_id=_NARRATOR,
                     text="Hello world",
-                    emotion="neutral",
+                    emotion=_NEUTRAL,
                     timeline_in_ms=0,
                     timeline_out_ms=1_800,
                 )
@@ -118,7 +125,7 @@ def build_manifest(assets_dir: Path):
             visual_assets=[
                 VisualAsset(
                     asset_id="bg_002",
-                    role="background",
+                    role=_BG,
                     asset_uri=img_uri("shot_002"),
                 )
             ],
@@ -129,7 +136,7 @@ def build_manifest(assets_dir: Path):
             visual_assets=[
                 VisualAsset(
                     asset_id="bg_003",
-                    role="background",
+                    role=_BG,
                     asset_uri=img_uri("shot_003"),
                 )
             ],
@@ -145,16 +152,16 @@ def build_manifest(assets_dir: Path):
             visual_assets=[
                 VisualAsset(
                     asset_id="bg_005",
-                    role="background",
+                    role=_BG,
                     asset_uri=img_uri("shot_001"),   # re-use shot_001 colour
                 )
             ],
             vo_lines=[
                 VOLine(
                     line_id="vo_002",
-                    speaker_id="narrator",
+                    speaker_id=_NARRATOR,
                     text="Goodbye",
-                    emotion="neutral",
+                    emotion=_NEUTRAL,
                     timeline_in_ms=200,
                     timeline_out_ms=1_600,
                 )
@@ -178,7 +185,7 @@ def build_plan(assets_dir: Path):
     return RenderPlan(
         plan_id="test-plan-5shots",
         project_id="test-project",
-        profile="preview_local",
+        profile=_PROFILE,
         resolution=Resolution(width=_W, height=_H, aspect="16:9"),
         fps=_FPS,
         asset_manifest_ref="file:///test/asset_manifest.json",
@@ -187,7 +194,7 @@ def build_plan(assets_dir: Path):
         # from the manifest directly, which exercises the fallback code path.
         fallback=FallbackConfig(
             placeholder_color="#1a1a2e",
-            placeholder_font_path="/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+            placeholder_font_path=_FONT,
             placeholder_font_size=36,
         ),
     )
@@ -203,15 +210,65 @@ def sample_plan(test_assets_dir: Path):
     return build_plan(test_assets_dir)
 
 
+@pytest.fixture(scope="session")
+def verify_fixture() -> dict:
+    """
+    {plan profile: (AssetManifest, RenderPlan)} from build_minimal_verify_fixture.
+
+    Built once per session; the models are frozen, so every consumer can
+    share the same instances.
+    """
+    from tests._fixture_builders import build_minimal_verify_fixture
+
+    return {
+        profile: build_minimal_verify_fixture(profile=profile)
+        for profile in ("preview_local", "high")
+    }
+
+
+@pytest.fixture(scope="session")
+def expected_total_ms(sample_manifest) -> int:
+    """Sum of shot durations in sample_manifest — computed once per session."""
+    return sum(s.duration_ms for s in sample_manifest.shots)
+
+
 # ---------------------------------------------------------------------------
 # FFmpeg availability check
 # ---------------------------------------------------------------------------
 
 @pytest.fixture(scope="session")
-def require_ffmpeg():
-    """Skip the test if ffmpeg is not available on PATH."""
-    result = subprocess.run(
-        ["ffmpeg", "-version"], capture_output=True, timeout=5
+def require_ffmpeg() -> str:
+    """
+    Skip the test if ffmpeg is not available on PATH.
+
+    Probed once per session; returns the installed version string
+    (e.g. "6.1.1") so callers can pin behaviour to it.  Render test classes
+    take it via @pytest.mark.usefixtures("require_ffmpeg").
+    """
+    from renderer.ffmpeg_runner import FFmpegNotFound, get_ffmpeg_version
+
+    try:
+        return get_ffmpeg_version()
+    except FFmpegNotFound as exc:
+        pytest.skip(f"ffmpeg not available — skipping render test. ({exc})")
+
+
+@pytest.fixture(scope="session")
+def require_pil() -> None:
+    """Skip the test if Pillow is not installed (checked once at import)."""
+    if not _PIL_AVAILABLE:
+        pytest.skip("Pillow not installed")
+
+
+# ---------------------------------------------------------------------------
+# Command-line options
+# ---------------------------------------------------------------------------
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--strict-golden",
+        action="store_true",
+        default=False,
+        help="Compare every frame's MD5 against the golden file instead of a "
+             "first/quarter/middle/three-quarter/last sample.",
     )
-    if result.returncode != 0:
-        pytest.skip("ffmpeg not available — skipping render test.")
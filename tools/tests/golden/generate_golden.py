@@ -38,6 +38,13 @@ _FPS = 24
 _SHOT_DUR_MS = 2_000
 TIMING_LOCK_HASH = "sha256:test-timing-lock-abc123"
 
+# Field values repeated across every shot / VO line; one shared str object each.
+_NARRATOR = "narrator"
+_NEUTRAL = "neutral"
+_BG = "background"
+_PROFILE = "preview_local"
+_FONT = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+
 _ASSET_COLORS: dict[str, tuple[int, int, int]] = {
     "shot_001": (200, 60,  60),
     "shot_002": (60,  200, 60),
@@ -46,13 +53,17 @@ _ASSET_COLORS: dict[str, tuple[int, int, int]] = {
 
 
 def _make_test_assets(assets_dir: Path) -> None:
-    """Generate deterministic solid-colour test PNG assets."""
+    """Generate deterministic solid-colour test PNG assets.
+
+    compress_level=1: zlib level only changes the PNG bytes, not the decoded
+    RGB that ffmpeg sees, so the golden bitstream is unaffected.
+    """
     from PIL import Image
     assets_dir.mkdir(parents=True, exist_ok=True)
     for name, color in _ASSET_COLORS.items():
         path = assets_dir / f"{name}.png"
         img = Image.new("RGB", (_W, _H), color=color)
-        img.save(str(path), format="PNG", compress_level=9, optimize=False)
+        img.save(str(path), format="PNG", compress_level=1, optimize=False)
         print(f"  wrote {path}")
 
 
@@ -71,22 +82,22 @@ def _build_manifest(assets_dir: Path):
             Shot(
                 shot_id="shot_001",
                 duration_ms=_SHOT_DUR_MS,
-                visual_assets=[VisualAsset(asset_id="bg_001", role="background",
+                visual_assets=[VisualAsset(asset_id="bg_001", role=_BG,
                                            asset_uri=uri("shot_001"))],
-                vo_lines=[VOLine(line_id="vo_001", speaker_id="narrator",
-                                 text="Hello world", emotion="neutral",
+                vo_lines=[VOLine(line_id="vo_001", speaker_id=_NARRATOR,
+                                 text="Hello world", emotion=_NEUTRAL,
                                  timeline_in_ms=0, timeline_out_ms=1_800)],
             ),
             Shot(
                 shot_id="shot_002",
                 duration_ms=_SHOT_DUR_MS,
-                visual_assets=[VisualAsset(asset_id="bg_002", role="background",
+                visual_assets=[VisualAsset(asset_id="bg_002", role=_BG,
                                            asset_uri=uri("shot_002"))],
             ),
             Shot(
                 shot_id="shot_003",
                 duration_ms=_SHOT_DUR_MS,
-                visual_assets=[VisualAsset(asset_id="bg_003", role="background",
+                visual_assets=[VisualAsset(asset_id="bg_003", role=_BG,
                                            asset_uri=uri("shot_003"))],
             ),
             Shot(
@@ -97,10 +108,10 @@ def _build_manifest(assets_dir: Path):
             Shot(
                 shot_id="shot_005",
                 duration_ms=_SHOT_DUR_MS,
-                visual_assets=[VisualAsset(asset_id="bg_005", role="background",
+                visual_assets=[VisualAsset(asset_id="bg_005", role=_BG,
                                            asset_uri=uri("shot_001"))],
-                vo_lines=[VOLine(line_id="vo_002", speaker_id="narrator",
-                                 text="Goodbye", emotion="neutral",
+                vo_lines=[VOLine(line_id="vo_002", speaker_id=_NARRATOR,
+                                 text="Goodbye", emotion=_NEUTRAL,
                                  timeline_in_ms=200, timeline_out_ms=1_600)],
             ),
         ],
@@ -113,26 +124,34 @@ def _build_plan():
     return RenderPlan(
         plan_id="test-plan-5shots",
         project_id="test-project",
-        profile="preview_local",
+        profile=_PROFILE,
         resolution=Resolution(width=_W, height=_H, aspect="16:9"),
         fps=_FPS,
         asset_manifest_ref="file:///test/asset_manifest.json",
         timing_lock_hash=TIMING_LOCK_HASH,
         fallback=FallbackConfig(
             placeholder_color="#1a1a2e",
-            placeholder_font_path="/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+            placeholder_font_path=_FONT,
             placeholder_font_size=36,
         ),
     )
 
 
 def _extract_frame_md5(video_path: Path) -> str:
-    result = subprocess.run(
-        ["ffmpeg", "-i", str(video_path), "-f", "framemd5", "-"],
-        capture_output=True, text=True, check=True,
+    md5_out = video_path.with_suffix(".framemd5")
+    subprocess.run(
+        [
+            "ffmpeg", "-hide_banner", "-loglevel", "error", "-nostats",
+            "-i", str(video_path),
+            "-f", "framemd5", "-y", str(md5_out),
+        ],
+        check=True,
     )
-    lines = [ln for ln in result.stdout.splitlines() if not ln.startswith("#")]
-    return "\n".join(lines)
+    data = md5_out.read_bytes()
+    start = 0
+    while data.startswith(b"#", start):   # skip the '#' header block
+        start = data.index(b"\n", start) + 1
+    return data[start:].decode("ascii").rstrip("\n")
 
 
 def main() -> None:
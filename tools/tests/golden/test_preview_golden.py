@@ -23,13 +23,15 @@ from __future__ import annotations
 
 import json
 import subprocess
+from dataclasses import dataclass
 from pathlib import Path
 
 import pytest
 
 from renderer.preview_local import PreviewRenderer
 from schemas.render_output import RenderOutput
-from verify_contracts import check_schema, CONTRACTS_DIR as _CONTRACTS_DIR
+from cli import contract_validator
+from verify_contracts import CONTRACTS_DIR as _CONTRACTS_DIR
 
 _SCHEMAS_DIR = _CONTRACTS_DIR / "schemas"
 
@@ -41,7 +43,7 @@ GOLDEN_HASH_FILE = EXPECTED_DIR / "render_preview_5shots.framemd5"
 # Helpers
 # ---------------------------------------------------------------------------
 
-def get_frame_md5(video_path: Path) -> str:
+def get_frame_md5(video_path: Path, md5_out: Path) -> str:
     """
     Extract per-frame MD5 hashes using ffmpeg -f framemd5.
 
@@ -49,31 +51,77 @@ def get_frame_md5(video_path: Path) -> str:
     (creation_time, encoder version strings, etc.), so it is stable across
     re-renders with the same ffmpeg major.minor version.
 
-    Comment lines (starting with '#') are stripped so the comparison is
-    insensitive to ffmpeg version comment strings.
+    ffmpeg writes straight to *md5_out*; the leading '#' comment block is
+    sliced off in one pass so the comparison is insensitive to ffmpeg
+    version comment strings.
     """
-    result = subprocess.run(
-        ["ffmpeg", "-i", str(video_path), "-f", "framemd5", "-"],
-        capture_output=True,
-        text=True,
+    subprocess.run(
+        [
+            "ffmpeg", "-hide_banner", "-loglevel", "error", "-nostats",
+            "-i", str(video_path),
+            "-f", "framemd5", "-y", str(md5_out),
+        ],
         check=True,
     )
-    lines = [ln for ln in result.stdout.splitlines() if not ln.startswith("#")]
-    return "\n".join(lines)
+    data = md5_out.read_bytes()
+    start = 0
+    while data.startswith(b"#", start):
+        start = data.index(b"\n", start) + 1
+    return data[start:].decode("ascii").rstrip("\n")
+
+
+def sample_frame_indices(n_frames: int) -> tuple[int, ...]:
+    """First / quarter / middle / three-quarter / last frame indices."""
+    return tuple(sorted({0, n_frames // 4, n_frames // 2, 3 * n_frames // 4, n_frames - 1}))
+
+
+def get_sampled_frame_md5(video_path: Path, frame_indices: tuple[int, ...]) -> list[str]:
+    """
+    MD5 of the decoded frames at *frame_indices* only (video stream 0).
+
+    One ffmpeg pass with a select filter: only the chosen frames are hashed
+    and written, and -fps_mode passthrough stops the muxer from duplicating
+    frames to fill the gaps.  Each MD5 matches the last column of the
+    corresponding line in a full framemd5 listing.
+    """
+    select = "+".join(f"eq(n\\,{i})" for i in frame_indices)
+    r = subprocess.run(
+        [
+            "ffmpeg", "-hide_banner", "-loglevel", "error", "-nostats",
+            "-i", str(video_path),
+            "-map", "0:v:0", "-vf", f"select={select}", "-fps_mode", "passthrough",
+            "-f", "framemd5", "-",
+        ],
+        stdout=subprocess.PIPE, check=True,
+    )
+    return [
+        ln.rsplit(b",", 1)[1].strip().decode("ascii")
+        for ln in r.stdout.splitlines()
+        if ln and not ln.startswith(b"#")
+    ]
+
+
+@dataclass(frozen=True, slots=True)
+class VideoInfo:
+    """Container/stream facts read from one ffprobe call."""
+    duration_sec: float
+    width: int
+    height: int
+    fps: float
 
 
-def ffprobe_video_info(video_path: Path) -> dict:
-    """Return a dict with {duration_sec, width, height, fps} via ffprobe."""
+def ffprobe_video_info(video_path: Path) -> VideoInfo:
+    """Return duration / width / height / fps via a single ffprobe call."""
     import json as _json
 
     r = subprocess.run(
         [
-            "ffprobe", "-v", "quiet",
+            "ffprobe", "-v", "error", "-hide_banner",
             "-print_format", "json",
             "-show_format", "-show_streams",
             str(video_path),
         ],
-        capture_output=True, text=True, check=True,
+        stdout=subprocess.PIPE, check=True,
     )
     data = _json.loads(r.stdout)
     fmt = data.get("format", {})
@@ -84,12 +132,42 @@ def ffprobe_video_info(video_path: Path) -> dict:
     fps_str = video_stream.get("r_frame_rate", "0/1")
     num, den = (int(x) for x in fps_str.split("/"))
     fps = num / den if den else 0.0
-    return {
-        "duration_sec": float(fmt.get("duration", 0)),
-        "width": int(video_stream.get("width", 0)),
-        "height": int(video_stream.get("height", 0)),
-        "fps": fps,
-    }
+    return VideoInfo(
+        duration_sec=float(fmt.get("duration", 0)),
+        width=int(video_stream.get("width", 0)),
+        height=int(video_stream.get("height", 0)),
+        fps=fps,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Shared render
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(scope="class")
+def rendered_preview(require_ffmpeg, sample_manifest, sample_plan, tmp_path_factory):
+    """
+    Render the 5-shot fixture once per class.
+
+    Most golden assertions only read output.mp4 / output.srt /
+    render_output.json, so a single ffmpeg run feeds all of them.
+    Yields {"out_dir": Path, "result": RenderOutput}.
+    """
+    out = tmp_path_factory.mktemp("preview_shared")
+    result = PreviewRenderer(sample_manifest, sample_plan, output_dir=out).render()
+    yield {"out_dir": out, "result": result}
+
+
+@pytest.fixture(scope="session")
+def render_output_validator():
+    """RenderOutput.v1.json Draft7Validator, compiled once per session."""
+    return contract_validator("RenderOutput", _SCHEMAS_DIR)
+
+
+@pytest.fixture(scope="class")
+def video_info(rendered_preview) -> VideoInfo:
+    """ffprobe facts for the shared render — one ffprobe call per class."""
+    return ffprobe_video_info(rendered_preview["out_dir"] / "output.mp4")
 
 
 # ---------------------------------------------------------------------------
@@ -97,31 +175,70 @@ def ffprobe_video_info(video_path: Path) -> dict:
 # ---------------------------------------------------------------------------
 
 @pytest.mark.slow
+@pytest.mark.xdist_group("golden_render")
+@pytest.mark.usefixtures("require_ffmpeg")
 class TestPreviewGolden:
 
-    @pytest.fixture(autouse=True)
-    def _need_ffmpeg(self, require_ffmpeg):
-        """All tests in this class require ffmpeg."""
-
     def test_deterministic_frame_hashes(
         self,
+        request,
+        rendered_preview,
         sample_manifest,
         sample_plan,
+        expected_total_ms,
         tmp_path: Path,
     ):
         """
-        Render the 5-shot fixture twice; both outputs must produce identical
-        framemd5 sequences.  Also compare against the committed golden file
-        if it exists.
+        Render the 5-shot fixture a second time; both outputs must produce
+        identical frame hashes.  Also compare against the committed golden
+        file if it exists.
+
+        By default only first/quarter/middle/three-quarter/last frames are
+        hashed — bit-identical encodes match everywhere or nowhere.  Pass
+        --strict-golden to hash and compare every frame.
         """
-        out_a = tmp_path / "render_a"
+        out_a = rendered_preview["out_dir"]
         out_b = tmp_path / "render_b"
 
-        PreviewRenderer(sample_manifest, sample_plan, output_dir=out_a).render()
         PreviewRenderer(sample_manifest, sample_plan, output_dir=out_b).render()
 
-        hash_a = get_frame_md5(out_a / "output.mp4")
-        hash_b = get_frame_md5(out_b / "output.mp4")
+        if request.config.getoption("--strict-golden"):
+            self._assert_full_frame_md5(out_a / "output.mp4", out_b / "output.mp4", tmp_path)
+            return
+
+        indices = sample_frame_indices(expected_total_ms * sample_plan.fps // 1000)
+        hash_a = get_sampled_frame_md5(out_a / "output.mp4", indices)
+        hash_b = get_sampled_frame_md5(out_b / "output.mp4", indices)
+
+        assert hash_a == hash_b, (
+            "Two renders of identical inputs produced different frame hashes.\n"
+            "This indicates a non-determinism bug in the renderer."
+        )
+
+        if GOLDEN_HASH_FILE.exists():
+            golden = [
+                ln.rsplit(",", 1)[1].strip()
+                for ln in GOLDEN_HASH_FILE.read_text().strip().splitlines()
+                if ln.startswith("0,")
+            ]
+            expected = [golden[i] for i in indices]
+            assert hash_a == expected, (
+                f"Sampled frame hash mismatch vs. golden file {GOLDEN_HASH_FILE} "
+                f"at frames {list(indices)}.\n"
+                f"If this is intentional, regenerate:\n"
+                f"    python tests/golden/generate_golden.py\n\n"
+                f"Expected: {expected}\nActual:   {hash_a}"
+            )
+        else:
+            pytest.skip(
+                f"Golden hash file not found: {GOLDEN_HASH_FILE}\n"
+                "Run `python tests/golden/generate_golden.py` to create it."
+            )
+
+    @staticmethod
+    def _assert_full_frame_md5(mp4_a: Path, mp4_b: Path, tmp_path: Path) -> None:
+        hash_a = get_frame_md5(mp4_a, tmp_path / "a.framemd5")
+        hash_b = get_frame_md5(mp4_b, tmp_path / "b.framemd5")
 
         assert hash_a == hash_b, (
             "Two renders of identical inputs produced different frame hashes.\n"
@@ -146,66 +263,68 @@ class TestPreviewGolden:
                 "Run `python tests/golden/generate_golden.py` to create it."
             )
 
-    def test_output_duration(self, sample_manifest, sample_plan, tmp_path: Path):
-        """Output video duration must match the sum of shot durations (±50 ms)."""
-        out = tmp_path / "render_dur"
-        PreviewRenderer(sample_manifest, sample_plan, output_dir=out).render()
+    # ── shared-render aspects ────────────────────────────────────────────────
+    # One parametrized node per aspect; all read the single class-scoped
+    # rendered_preview.  Each _check_<aspect> pulls the extra fixtures it needs
+    # through request.getfixturevalue so unused ones (e.g. ffprobe) stay lazy.
+
+    @pytest.mark.parametrize(
+        "aspect",
+        ["duration", "resolution", "placeholder", "srt", "json_schema", "contract_schema"],
+    )
+    def test_rendered_output(self, aspect: str, request, rendered_preview):
+        getattr(self, f"_check_{aspect}")(request, rendered_preview)
 
-        expected_ms = sum(s.duration_ms for s in sample_manifest.shots)
-        info = ffprobe_video_info(out / "output.mp4")
-        actual_ms = int(info["duration_sec"] * 1000)
+    @staticmethod
+    def _check_duration(request, rendered_preview):
+        """Output video duration must match the sum of shot durations (±50 ms)."""
+        video_info = request.getfixturevalue("video_info")
+        expected_ms = request.getfixturevalue("expected_total_ms")
+        actual_ms = int(video_info.duration_sec * 1000)
 
         assert abs(actual_ms - expected_ms) <= 50, (
             f"Duration mismatch: expected {expected_ms} ms, got {actual_ms} ms"
         )
 
-    def test_output_resolution(self, sample_manifest, sample_plan, tmp_path: Path):
+    @staticmethod
+    def _check_resolution(request, rendered_preview):
         """Output resolution must match RenderPlan exactly."""
-        out = tmp_path / "render_res"
-        PreviewRenderer(sample_manifest, sample_plan, output_dir=out).render()
+        video_info = request.getfixturevalue("video_info")
+        sample_plan = request.getfixturevalue("sample_plan")
 
-        info = ffprobe_video_info(out / "output.mp4")
-        assert info["width"] == sample_plan.resolution.width
-        assert info["height"] == sample_plan.resolution.height
+        assert video_info.width == sample_plan.resolution.width
+        assert video_info.height == sample_plan.resolution.height
 
-    def test_placeholder_shot_does_not_abort_render(
-        self, sample_manifest, sample_plan, tmp_path: Path
-    ):
+    @staticmethod
+    def _check_placeholder(request, rendered_preview):
         """
         shot_004 has no visual asset; the render must complete and report
         placeholder_count >= 1.
         """
-        out = tmp_path / "render_ph"
-        result = PreviewRenderer(sample_manifest, sample_plan, output_dir=out).render()
+        out = rendered_preview["out_dir"]
+        result = rendered_preview["result"]
 
         assert (out / "output.mp4").exists()
         assert result.provenance.placeholder_count >= 1
 
-    def test_srt_captions_generated(self, sample_manifest, sample_plan, tmp_path: Path):
+    @staticmethod
+    def _check_srt(request, rendered_preview):
         """output.srt must exist and contain the expected speaker labels."""
-        out = tmp_path / "render_srt"
-        PreviewRenderer(sample_manifest, sample_plan, output_dir=out).render()
-
-        srt_path = out / "output.srt"
+        srt_path = rendered_preview["out_dir"] / "output.srt"
         assert srt_path.exists()
-        content = srt_path.read_text(encoding="utf-8")
-        assert "narrator:" in content   # speaker_id preserved as-is (no .upper())
-        assert "Hello world" in content
-        assert "Goodbye" in content
-
-    def test_render_output_json_schema_valid(
-        self, sample_manifest, sample_plan, tmp_path: Path
-    ):
-        """render_output.json must round-trip through the Pydantic model AND pass
-        the canonical RenderOutput.v1.json contract schema."""
-        out = tmp_path / "render_json"
-        result = PreviewRenderer(sample_manifest, sample_plan, output_dir=out).render()
-
-        json_path = out / "render_output.json"
+        content = srt_path.read_bytes()   # ASCII needles: no UTF-8 decode needed
+        assert b"narrator:" in content   # speaker_id preserved as-is (no .upper())
+        assert b"Hello world" in content
+        assert b"Goodbye" in content
+
+    @staticmethod
+    def _check_json_schema(request, rendered_preview):
+        """render_output.json must round-trip through the Pydantic model."""
+        result = rendered_preview["result"]
+        json_path = rendered_preview["out_dir"] / "render_output.json"
         assert json_path.exists()
 
-        # Re-parse from disk and verify Pydantic-level fields.
-        from_disk = RenderOutput.model_validate_json(json_path.read_text())
+        from_disk = RenderOutput.model_validate_json(json_path.read_bytes())
         assert from_disk.lineage.asset_manifest_hash == result.lineage.asset_manifest_hash
         assert from_disk.hashes.video_sha256 == result.hashes.video_sha256
         assert from_disk.provenance.render_profile == "preview"
@@ -213,9 +332,14 @@ class TestPreviewGolden:
         assert from_disk.schema_id == "RenderOutput"
         assert from_disk.producer.name == "PreviewRenderer"
 
-        # Validate the on-disk JSON against the canonical contract schema.
-        data = json.loads(json_path.read_text())
-        errors = check_schema(data, "RenderOutput", _SCHEMAS_DIR)
+    @staticmethod
+    def _check_contract_schema(request, rendered_preview):
+        """render_output.json must pass the canonical RenderOutput.v1.json contract."""
+        validator = request.getfixturevalue("render_output_validator")
+        json_path = rendered_preview["out_dir"] / "render_output.json"
+
+        data = json.loads(json_path.read_bytes())
+        errors = [e.message for e in validator.iter_errors(data)]
         assert errors == [], (
             "render_output.json failed RenderOutput.v1.json contract:\n"
             + "\n".join(errors)
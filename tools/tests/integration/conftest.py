@@ -0,0 +1,129 @@
+"""
+Shared fixtures for tools/tests/integration/.
+
+Provides:
+  - session-scoped `video verify` runs so every test that only inspects the
+    exit code / stdout / stderr of one profile shares a single run (each
+    verify internally renders the fixture twice)
+  - video_mod: scripts/video.py loaded once per session for in-process calls
+  - video_main: run `video <argv>` in-process via main(argv), returning a
+    CompletedProcess so callers read it exactly like subprocess.run output
+  - verify_fixture_files / render_fixture_files: the minimal fixture on disk,
+    written once per profile and shared by every CLI run that consumes it
+  - manifest_plan_paths: sample_manifest / sample_plan serialised to disk once
+    and shared (read-only) by every CLI run that consumes them
+"""
+from __future__ import annotations
+
+import importlib.util
+import io
+import subprocess
+import sys
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+VIDEO_SCRIPT = Path(__file__).resolve().parents[3] / "scripts" / "video.py"
+
+
+def _run_verify(*extra: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, str(VIDEO_SCRIPT), "verify", *extra],
+        capture_output=True, text=True,
+    )
+
+
+@pytest.fixture(scope="session")
+def _verify_preview_run(require_ffmpeg, require_pil) -> subprocess.CompletedProcess:
+    """
+    `video verify` with the default profile (--profile preview).
+
+    Kept as a real subprocess: test_stderr_empty_on_success asserts on the
+    whole process's stderr, which includes anything the ffmpeg children write.
+    """
+    return _run_verify()
+
+
+@pytest.fixture(scope="session")
+def _verify_preview_explicit_run(require_ffmpeg, video_main) -> subprocess.CompletedProcess:
+    """`video verify --profile preview` (in-process; only exit code / stdout are checked)."""
+    return video_main("verify", "--profile", "preview")
+
+
+@pytest.fixture(scope="session")
+def _verify_high_run(require_ffmpeg, video_main) -> subprocess.CompletedProcess:
+    """`video verify --profile high` (in-process; only exit code / stdout are checked)."""
+    return video_main("verify", "--profile", "high")
+
+
+@pytest.fixture(scope="session")
+def video_mod(require_pil):
+    """scripts/video.py as a module (loaded once; re-exports tools/cli.py)."""
+    spec = importlib.util.spec_from_file_location("video_cli", VIDEO_SCRIPT)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+@pytest.fixture(scope="session")
+def manifest_plan_paths(tmp_path_factory, sample_manifest, sample_plan) -> tuple[Path, Path]:
+    """(AssetManifest.json, RenderPlan.json) for the golden sample fixtures."""
+    d = tmp_path_factory.mktemp("shared_fixtures")
+    mp = d / "AssetManifest.json"
+    pp = d / "RenderPlan.json"
+    mp.write_bytes(sample_manifest.__pydantic_serializer__.to_json(sample_manifest))
+    pp.write_bytes(sample_plan.__pydantic_serializer__.to_json(sample_plan))
+    return mp, pp
+
+
+@pytest.fixture(scope="session")
+def video_main(video_mod) -> Callable[..., subprocess.CompletedProcess]:
+    """
+    In-process `video <argv>`: no interpreter start-up or re-import per call.
+
+    main() always ends in sys.exit(); its code becomes returncode.  Only
+    Python-level stdout/stderr are captured — tests asserting on output
+    written by child processes (ffmpeg) must keep using subprocess.run.
+    """
+    def run(*argv: str) -> subprocess.CompletedProcess:
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            try:
+                video_mod.main(list(argv))
+                code = 0
+            except SystemExit as exc:
+                code = exc.code if isinstance(exc.code, int) else int(exc.code is not None)
+        return subprocess.CompletedProcess(
+            ["video", *argv], code, stdout.getvalue(), stderr.getvalue()
+        )
+
+    return run
+
+
+@pytest.fixture(scope="session")
+def verify_fixture_files(
+    require_pil, tmp_path_factory, verify_fixture
+) -> dict[str, tuple[Path, Path]]:
+    """
+    {plan profile: (AssetManifest.json, RenderPlan.json)} for verify_fixture.
+
+    Each profile is serialised exactly once per session; every CLI run that
+    takes the minimal fixture reads these same (read-only) files.
+    """
+    files = {}
+    for profile, (manifest, plan) in verify_fixture.items():
+        d = tmp_path_factory.mktemp(f"verify_fixture_{profile}")
+        manifest_path = d / "AssetManifest.json"
+        plan_path = d / "RenderPlan.json"
+        manifest_path.write_bytes(manifest.__pydantic_serializer__.to_json(manifest))
+        plan_path.write_bytes(plan.__pydantic_serializer__.to_json(plan))
+        files[profile] = manifest_path, plan_path
+    return files
+
+
+@pytest.fixture(scope="session")
+def render_fixture_files(verify_fixture_files) -> tuple[Path, Path]:
+    """The preview_local minimal fixture on disk, for `video render` runs."""
+    return verify_fixture_files["preview_local"]
@@ -6,7 +6,7 @@ Uses the golden fixture builders (build_manifest / build_plan via sample_manifes
 required.
 
 Marked @pytest.mark.slow (requires ffmpeg). The CLI is invoked once per test
-class via the class-scoped ``cli_out`` fixture.
+session via the session-scoped ``cli_out`` / ``verify_out`` fixtures.
 """
 from __future__ import annotations
 
@@ -26,15 +26,77 @@ SMOKE_SCRIPT = Path(__file__).resolve().parents[3] / "scripts" / "render_from_or
 # ---------------------------------------------------------------------------
 
 def _sha256_file(path: Path) -> str:
-    h = hashlib.sha256()
     with open(path, "rb") as fh:
-        for chunk in iter(lambda: fh.read(65_536), b""):
-            h.update(chunk)
-    return h.hexdigest()
+        return hashlib.file_digest(fh, "sha256").hexdigest()
 
 
-def _sha256_text(text: str) -> str:
-    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+def _sha256_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Session-scoped CLI runs — each CLI invocation happens once per session
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(scope="session")
+def cli_out(require_ffmpeg, tmp_path_factory, manifest_plan_paths, sample_plan):
+    """
+    Invoke smoke_render.py once on the shared native-format JSON files and
+    return a dict with:
+      out_dir  — Path to the render output directory
+      stdout   — captured stdout bytes from the CLI (json.loads-ready)
+      plan     — the RenderPlan object (for hash assertions)
+    """
+    manifest_path, plan_path = manifest_plan_paths
+    out_dir = tmp_path_factory.mktemp("cli_smoke_out", numbered=True)
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            str(SMOKE_SCRIPT),
+            "--asset-manifest", str(manifest_path),
+            "--render-plan", str(plan_path),
+            "--out-dir", str(out_dir),
+        ],
+        capture_output=True,
+    )
+    assert result.returncode == 0, (
+        f"smoke_render.py exited with code {result.returncode}:\n"
+        f"STDOUT:\n{result.stdout.decode('utf-8', 'replace')}\n"
+        f"STDERR:\n{result.stderr.decode('utf-8', 'replace')}"
+    )
+    return {
+        "out_dir": out_dir,
+        "stdout": result.stdout,
+        "plan": sample_plan,
+        "manifest_path": manifest_path,
+    }
+
+
+@pytest.fixture(scope="session")
+def verify_out(require_ffmpeg, tmp_path_factory, manifest_plan_paths):
+    manifest_path, plan_path = manifest_plan_paths
+    out_dir = tmp_path_factory.mktemp("verify_cli_out")
+    result = subprocess.run(
+        [sys.executable, str(SMOKE_SCRIPT),
+         "--asset-manifest", str(manifest_path),
+         "--render-plan",    str(plan_path),
+         "--out-dir",        str(out_dir),
+         "--verify"],
+        capture_output=True,
+    )
+    assert result.returncode == 0, (
+        f"--verify exited {result.returncode}:\n"
+        f"{result.stdout.decode('utf-8', 'replace')}\n"
+        f"{result.stderr.decode('utf-8', 'replace')}"
+    )
+    return {"out_dir": out_dir, "stdout": result.stdout}
+
+
+@pytest.fixture(scope="session")
+def render_output_data(cli_out) -> dict:
+    """render_output.json from the shared CLI run, read and parsed once."""
+    return json.loads((cli_out["out_dir"] / "render_output.json").read_bytes())
 
 
 # ---------------------------------------------------------------------------
@@ -42,54 +104,11 @@ def _sha256_text(text: str) -> str:
 # ---------------------------------------------------------------------------
 
 @pytest.mark.slow
+@pytest.mark.xdist_group("cli_smoke")
+@pytest.mark.usefixtures("require_ffmpeg")
 class TestRenderCliSmoke:
     """Run smoke_render.py with native-format fixtures and assert contract fields."""
 
-    @pytest.fixture(autouse=True)
-    def _need_ffmpeg(self, require_ffmpeg):
-        """All tests in this class require ffmpeg."""
-
-    @pytest.fixture(scope="class")
-    def cli_out(self, tmp_path_factory, sample_manifest, sample_plan):
-        """
-        Serialise native-format JSON files, invoke smoke_render.py once, and
-        return a dict with:
-          out_dir  — Path to the render output directory
-          stdout   — captured stdout string from the CLI
-          plan     — the RenderPlan object (for hash assertions)
-        """
-        run_dir = tmp_path_factory.mktemp("cli_smoke_run", numbered=True)
-        manifest_path = run_dir / "AssetManifest.json"
-        plan_path = run_dir / "RenderPlan.json"
-
-        manifest_path.write_text(sample_manifest.model_dump_json(), encoding="utf-8")
-        plan_path.write_text(sample_plan.model_dump_json(), encoding="utf-8")
-
-        out_dir = tmp_path_factory.mktemp("cli_smoke_out", numbered=True)
-
-        result = subprocess.run(
-            [
-                sys.executable,
-                str(SMOKE_SCRIPT),
-                "--asset-manifest", str(manifest_path),
-                "--render-plan", str(plan_path),
-                "--out-dir", str(out_dir),
-            ],
-            capture_output=True,
-            text=True,
-        )
-        assert result.returncode == 0, (
-            f"smoke_render.py exited with code {result.returncode}:\n"
-            f"STDOUT:\n{result.stdout}\n"
-            f"STDERR:\n{result.stderr}"
-        )
-        return {
-            "out_dir": out_dir,
-            "stdout": result.stdout,
-            "plan": sample_plan,
-            "manifest_path": manifest_path,
-        }
-
     # -----------------------------------------------------------------------
     # Output artefact existence
     # -----------------------------------------------------------------------
@@ -116,15 +135,15 @@ class TestRenderCliSmoke:
     # Hash integrity
     # -----------------------------------------------------------------------
 
-    def test_video_sha256_matches(self, cli_out):
-        data = json.loads((cli_out["out_dir"] / "render_output.json").read_text())
+    def test_video_sha256_matches(self, cli_out, render_output_data):
+        data = render_output_data
         actual = _sha256_file(cli_out["out_dir"] / "output.mp4")
         assert data["hashes"]["video_sha256"] == actual
 
-    def test_captions_sha256_matches(self, cli_out):
-        data = json.loads((cli_out["out_dir"] / "render_output.json").read_text())
-        actual = _sha256_text(
-            (cli_out["out_dir"] / "output.srt").read_text(encoding="utf-8")
+    def test_captions_sha256_matches(self, cli_out, render_output_data):
+        data = render_output_data
+        actual = _sha256_bytes(
+            (cli_out["out_dir"] / "output.srt").read_bytes()
         )
         assert data["hashes"]["captions_sha256"] == actual
 
@@ -132,46 +151,22 @@ class TestRenderCliSmoke:
     # Provenance / lineage fields
     # -----------------------------------------------------------------------
 
-    def test_timing_lock_hash(self, cli_out):
-        data = json.loads((cli_out["out_dir"] / "render_output.json").read_text())
+    def test_timing_lock_hash(self, cli_out, render_output_data):
+        data = render_output_data
         assert data["provenance"]["timing_lock_hash"] == cli_out["plan"].timing_lock_hash
 
-    def test_asset_manifest_ref(self, cli_out):
-        data = json.loads((cli_out["out_dir"] / "render_output.json").read_text())
-        assert data["asset_manifest_ref"].startswith("file://")
+    def test_asset_manifest_ref(self, render_output_data):
+        assert render_output_data["asset_manifest_ref"].startswith("file://")
 
-    def test_renderer_field(self, cli_out):
-        data = json.loads((cli_out["out_dir"] / "render_output.json").read_text())
-        assert data["provenance"]["renderer"] == "video"
+    def test_renderer_field(self, render_output_data):
+        assert render_output_data["provenance"]["renderer"] == "video"
 
 
 @pytest.mark.slow
+@pytest.mark.xdist_group("cli_verify")
+@pytest.mark.usefixtures("require_ffmpeg")
 class TestVerifyCli:
 
-    @pytest.fixture(autouse=True)
-    def _need_ffmpeg(self, require_ffmpeg): ...
-
-    @pytest.fixture(scope="class")
-    def verify_out(self, tmp_path_factory, sample_manifest, sample_plan):
-        run_dir = tmp_path_factory.mktemp("verify_cli_run")
-        manifest_path = run_dir / "AssetManifest.json"
-        plan_path = run_dir / "RenderPlan.json"
-        manifest_path.write_text(sample_manifest.model_dump_json(), encoding="utf-8")
-        plan_path.write_text(sample_plan.model_dump_json(), encoding="utf-8")
-        out_dir = tmp_path_factory.mktemp("verify_cli_out")
-        result = subprocess.run(
-            [sys.executable, str(SMOKE_SCRIPT),
-             "--asset-manifest", str(manifest_path),
-             "--render-plan",    str(plan_path),
-             "--out-dir",        str(out_dir),
-             "--verify"],
-            capture_output=True, text=True,
-        )
-        assert result.returncode == 0, (
-            f"--verify exited {result.returncode}:\n{result.stdout}\n{result.stderr}"
-        )
-        return {"out_dir": out_dir, "stdout": result.stdout}
-
     def test_fingerprint_json_exists(self, verify_out):
         assert (verify_out["out_dir"] / "render_fingerprint.json").exists()
 
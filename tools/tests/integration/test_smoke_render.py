@@ -18,40 +18,37 @@ SMOKE_SCRIPT = Path(__file__).resolve().parents[3] / "scripts" / "render_from_or
 _EXPECTED_HASH = "12fc3b425b23b76456ebda4a86848ab0da27d0f833a63fdbaeaf1b6f44904b7e"
 
 
-@pytest.mark.slow
-class TestSmokeRender:
-    @pytest.fixture(autouse=True)
-    def _need_ffmpeg(self, require_ffmpeg):
-        """All tests require ffmpeg."""
-
-    @pytest.fixture(autouse=True, scope="class")
-    def _need_artifacts(self):
-        if not MANIFEST_PATH.exists() or not PLAN_PATH.exists():
-            pytest.skip(f"Orchestrator artifacts not found at {ARTIFACTS}")
+@pytest.fixture(scope="session")
+def smoke_out(require_ffmpeg, tmp_path_factory):
+    """Run smoke_render.py once per session; return the output directory."""
+    if not MANIFEST_PATH.exists() or not PLAN_PATH.exists():
+        pytest.skip(f"Orchestrator artifacts not found at {ARTIFACTS}")
+    out = tmp_path_factory.mktemp("smoke_out")
+    result = subprocess.run(
+        [
+            sys.executable,
+            str(SMOKE_SCRIPT),
+            "--asset-manifest",
+            str(MANIFEST_PATH),
+            "--render-plan",
+            str(PLAN_PATH),
+            "--out-dir",
+            str(out),
+        ],
+        capture_output=True,
+    )
+    assert result.returncode == 0, (
+        f"smoke_render.py failed:\n"
+        f"STDOUT:\n{result.stdout.decode('utf-8', 'replace')}\n"
+        f"STDERR:\n{result.stderr.decode('utf-8', 'replace')}"
+    )
+    return out
 
-    @pytest.fixture(scope="class")
-    def smoke_out(self, tmp_path_factory):
-        """Run smoke_render.py once; return the output directory."""
-        out = tmp_path_factory.mktemp("smoke_out")
-        result = subprocess.run(
-            [
-                sys.executable,
-                str(SMOKE_SCRIPT),
-                "--asset-manifest",
-                str(MANIFEST_PATH),
-                "--render-plan",
-                str(PLAN_PATH),
-                "--out-dir",
-                str(out),
-            ],
-            capture_output=True,
-            text=True,
-        )
-        assert result.returncode == 0, (
-            f"smoke_render.py failed:\nSTDOUT:\n{result.stdout}\nSTDERR:\n{result.stderr}"
-        )
-        return out
 
+@pytest.mark.slow
+@pytest.mark.xdist_group("orch_smoke")
+@pytest.mark.usefixtures("require_ffmpeg")
+class TestSmokeRender:
     def test_mp4_exists(self, smoke_out):
         assert (smoke_out / "output.mp4").exists()
 
@@ -62,10 +59,10 @@ class TestSmokeRender:
         assert (smoke_out / "render_output.json").exists()
 
     def test_timing_lock_hash(self, smoke_out):
-        data = json.loads((smoke_out / "render_output.json").read_text())
+        data = json.loads((smoke_out / "render_output.json").read_bytes())
         assert data["provenance"]["timing_lock_hash"] == _EXPECTED_HASH
 
     def test_render_plan_ref(self, smoke_out):
-        data = json.loads((smoke_out / "render_output.json").read_text())
+        data = json.loads((smoke_out / "render_output.json").read_bytes())
         expected_ref = f"file://{PLAN_PATH.resolve()}"
         assert data["render_plan_ref"] == expected_ref
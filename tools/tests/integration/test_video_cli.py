@@ -4,73 +4,41 @@ Requires ffmpeg + Pillow. Marked @pytest.mark.slow.
 """
 from __future__ import annotations
 
-import importlib
-import importlib.util
 import json
-import subprocess
-import sys
 from pathlib import Path
 
 import pytest
 
-VIDEO_SCRIPT = Path(__file__).resolve().parents[3] / "scripts" / "video.py"
-
 
 @pytest.mark.slow
+@pytest.mark.xdist_group("video_verify")
+@pytest.mark.usefixtures("require_ffmpeg")
 class TestVideoVerifyCli:
 
-    @pytest.fixture(autouse=True)
-    def _need_ffmpeg(self, require_ffmpeg): ...
-
-    @pytest.fixture(scope="class")
-    def verify_run(self):
-        try:
-            from PIL import Image  # noqa: F401
-        except ImportError:
-            pytest.skip("Pillow not installed")
-        return subprocess.run(
-            [sys.executable, str(VIDEO_SCRIPT), "verify"],
-            capture_output=True, text=True,
-        )
-
-    def test_exit_code_zero(self, verify_run):
-        assert verify_run.returncode == 0, (
-            f"video verify failed:\nSTDOUT: {verify_run.stdout}\n"
-            f"STDERR: {verify_run.stderr}"
+    def test_exit_code_zero(self, _verify_preview_run):
+        assert _verify_preview_run.returncode == 0, (
+            f"video verify failed:\nSTDOUT: {_verify_preview_run.stdout}\n"
+            f"STDERR: {_verify_preview_run.stderr}"
         )
 
-    def test_ok_stdout(self, verify_run):
-        assert verify_run.stdout.strip() == "OK: video verified"
+    def test_ok_stdout(self, _verify_preview_run):
+        assert _verify_preview_run.stdout.strip() == "OK: video verified"
 
-    def test_stderr_empty_on_success(self, verify_run):
-        assert verify_run.stderr == ""
+    def test_stderr_empty_on_success(self, _verify_preview_run):
+        assert _verify_preview_run.stderr == ""
 
-    def test_unknown_command_exits_nonzero(self):
-        result = subprocess.run(
-            [sys.executable, str(VIDEO_SCRIPT), "bogus"],
-            capture_output=True, text=True,
-        )
-        assert result.returncode != 0
+    def test_unknown_command_exits_nonzero(self, video_main):
+        assert video_main("bogus").returncode != 0
 
 
 @pytest.mark.slow
+@pytest.mark.usefixtures("require_ffmpeg")
 class TestVideoVerifyDeterminismFailure:
     """Verify that a corrupted frame hash causes cmd_verify() to fail."""
 
-    @pytest.fixture(autouse=True)
-    def _need_ffmpeg(self, require_ffmpeg): ...
-
-    def test_frame_hash_corruption_exits_nonzero(self, monkeypatch, capsys):
-        try:
-            from PIL import Image  # noqa: F401
-        except ImportError:
-            pytest.skip("Pillow not installed")
-
-        # Load video module so its globals (e.g. _fingerprint_bytes) are fresh
-        spec = importlib.util.spec_from_file_location("video_cli", VIDEO_SCRIPT)
-        video_mod = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(video_mod)
-
+    def test_frame_hash_corruption_exits_nonzero(self, video_mod, monkeypatch, capsys):
+        # video_mod is shared for the session; the patch below targets the
+        # PreviewRenderer class and monkeypatch restores it afterwards.
         from renderer.preview_local import PreviewRenderer
 
         original_verify = PreviewRenderer.verify
@@ -101,46 +69,24 @@ class TestVideoVerifyDeterminismFailure:
 
 
 @pytest.mark.slow
+@pytest.mark.xdist_group("video_verify")
+@pytest.mark.usefixtures("require_ffmpeg")
 class TestVideoVerifyProfile:
     """Test --profile flag for both preview and high profiles."""
 
-    @pytest.fixture(autouse=True)
-    def _need_ffmpeg(self, require_ffmpeg): ...
-
-    def test_profile_preview_explicit_exits_zero(self):
-        try:
-            from PIL import Image  # noqa: F401
-        except ImportError:
-            pytest.skip("Pillow not installed")
-        result = subprocess.run(
-            [sys.executable, str(VIDEO_SCRIPT), "verify", "--profile", "preview"],
-            capture_output=True, text=True,
-        )
+    def test_profile_preview_explicit_exits_zero(self, _verify_preview_explicit_run):
+        result = _verify_preview_explicit_run
         assert result.returncode == 0, result.stderr
         assert result.stdout.strip() == "OK: video verified"
 
-    def test_profile_high_exits_zero(self):
-        try:
-            from PIL import Image  # noqa: F401
-        except ImportError:
-            pytest.skip("Pillow not installed")
-        result = subprocess.run(
-            [sys.executable, str(VIDEO_SCRIPT), "verify", "--profile", "high"],
-            capture_output=True, text=True,
-        )
+    def test_profile_high_exits_zero(self, _verify_high_run):
+        result = _verify_high_run
         assert result.returncode == 0, result.stderr
         assert result.stdout.strip() == "OK: video verified"
 
-    def test_preview_and_high_fingerprints_differ(self, tmp_path):
+    def test_preview_and_high_fingerprints_differ(self, tmp_path, video_mod):
         """Preview and high profiles must produce different fingerprint bytes."""
-        try:
-            from PIL import Image  # noqa: F401
-        except ImportError:
-            pytest.skip("Pillow not installed")
         import tempfile
-        spec = importlib.util.spec_from_file_location("video_cli", VIDEO_SCRIPT)
-        video_mod = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(video_mod)
         with (tempfile.TemporaryDirectory() as dp,
               tempfile.TemporaryDirectory() as dh):
             bp = video_mod._fingerprint_bytes(Path(dp), profile="preview")
@@ -149,78 +95,57 @@ class TestVideoVerifyProfile:
 
 
 @pytest.mark.slow
+@pytest.mark.xdist_group("audit_render")
+@pytest.mark.usefixtures("require_ffmpeg")
 class TestVideoAuditRenderCli:
     """Tests for `video audit-render` subcommand."""
 
-    @pytest.fixture(autouse=True)
-    def _need_ffmpeg(self, require_ffmpeg): ...
+    @pytest.fixture(scope="class")
+    def fixture_files(self, verify_fixture_files):
+        """The minimal fixture manifest+plan on disk for CLI consumption."""
+        return verify_fixture_files["preview_local"]
 
     @pytest.fixture(scope="class")
-    def fixture_files(self, tmp_path_factory):
-        """Write the minimal fixture manifest+plan to disk for CLI consumption."""
-        try:
-            from PIL import Image  # noqa: F401
-        except ImportError:
-            pytest.skip("Pillow not installed")
-        import sys; sys.path.insert(0, str(VIDEO_SCRIPT.parents[1] / "tools"))
-        from tests._fixture_builders import build_minimal_verify_fixture
-        manifest, plan = build_minimal_verify_fixture()
-        d = tmp_path_factory.mktemp("audit_fixtures")
-        manifest_path = d / "asset_manifest.json"
-        plan_path     = d / "render_plan.json"
-        manifest_path.write_text(manifest.model_dump_json(indent=2))
-        plan_path.write_text(plan.model_dump_json(indent=2))
-        return manifest_path, plan_path
-
-    def test_audit_exits_zero_on_deterministic_inputs(self, fixture_files):
+    def audit_run(self, video_main, fixture_files):
+        """One `audit-render` run shared by the exit-code and stdout tests."""
         manifest_path, plan_path = fixture_files
-        result = subprocess.run(
-            [sys.executable, str(VIDEO_SCRIPT), "audit-render",
-             str(plan_path), str(manifest_path)],
-            capture_output=True, text=True,
-        )
-        assert result.returncode == 0, result.stderr
+        return video_main("audit-render", str(plan_path), str(manifest_path))
 
-    def test_audit_stdout_is_valid_json(self, fixture_files):
+    @pytest.fixture(scope="class")
+    def audit_dry_run(self, video_main, fixture_files):
+        """One `audit-render --dry-run` run shared by the exit-code and stdout tests."""
         manifest_path, plan_path = fixture_files
-        result = subprocess.run(
-            [sys.executable, str(VIDEO_SCRIPT), "audit-render",
-             str(plan_path), str(manifest_path)],
-            capture_output=True, text=True,
-        )
+        return video_main("audit-render", str(plan_path), str(manifest_path), "--dry-run")
+
+    def test_audit_exits_zero_on_deterministic_inputs(self, audit_run):
+        result = audit_run
+        assert result.returncode == 0, result.stderr
+
+    def test_audit_stdout_is_valid_json(self, audit_run):
+        result = audit_run
         data = json.loads(result.stdout)
         assert data["status"] == "pass"
         assert data["diff_fields"] == []
 
-    def test_audit_dry_run_exits_zero(self, fixture_files):
-        manifest_path, plan_path = fixture_files
-        result = subprocess.run(
-            [sys.executable, str(VIDEO_SCRIPT), "audit-render",
-             str(plan_path), str(manifest_path), "--dry-run"],
-            capture_output=True, text=True,
-        )
+    def test_audit_dry_run_exits_zero(self, audit_dry_run):
+        result = audit_dry_run
         assert result.returncode == 0, result.stderr
 
-    def test_audit_dry_run_status_pass(self, fixture_files):
-        manifest_path, plan_path = fixture_files
-        result = subprocess.run(
-            [sys.executable, str(VIDEO_SCRIPT), "audit-render",
-             str(plan_path), str(manifest_path), "--dry-run"],
-            capture_output=True, text=True,
-        )
+    def test_audit_dry_run_status_pass(self, audit_dry_run):
+        result = audit_dry_run
         data = json.loads(result.stdout)
         assert data["status"] == "pass"
 
-    def test_audit_missing_plan_exits_nonzero(self, tmp_path):
-        result = subprocess.run(
-            [sys.executable, str(VIDEO_SCRIPT), "audit-render",
-             str(tmp_path / "missing.json"), str(tmp_path / "m.json")],
-            capture_output=True, text=True,
+    def test_audit_missing_plan_exits_nonzero(self, tmp_path, video_main):
+        result = video_main(
+            "audit-render", str(tmp_path / "missing.json"), str(tmp_path / "m.json")
         )
         assert result.returncode != 0
 
 
 @pytest.mark.slow
+@pytest.mark.xdist_group("hash_pins")
+@pytest.mark.usefixtures("require_ffmpeg")
 class TestVideoVerifyHashPins:
     """
     T1: default render → mp4_sha256 == pinned_preview
@@ -232,110 +157,76 @@ class TestVideoVerifyHashPins:
     _PINNED_PREVIEW = "b4a44e354dc6e8808a94a59b7bd402e0496e3d1489223a20a92132a7c8ecd6a9"
     _PINNED_HIGH    = "5e41afd474b4d812d3bcabb226f3effea0f6cdce277eaba48d6d5d2fce0dcaf8"
 
-    @pytest.fixture(autouse=True)
-    def _need_ffmpeg(self, require_ffmpeg): ...
-
     @pytest.fixture(scope="class")
-    def video_mod(self):
-        try:
-            from PIL import Image  # noqa: F401
-        except ImportError:
-            pytest.skip("Pillow not installed")
-        spec = importlib.util.spec_from_file_location("video_cli", VIDEO_SCRIPT)
-        mod = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(mod)
-        return mod
-
-    @pytest.fixture(scope="class")
-    def default_fp(self, video_mod, tmp_path_factory):
+    def default_mp4_hash(self, video_mod, tmp_path_factory) -> str:
         d = tmp_path_factory.mktemp("default_fp")
-        return json.loads(video_mod._fingerprint_bytes(d))   # no profile → default
+        # no profile → default
+        return json.loads(video_mod._fingerprint_bytes(d))["mp4_sha256"]
 
     @pytest.fixture(scope="class")
-    def preview_fp(self, video_mod, tmp_path_factory):
+    def preview_mp4_hash(self, video_mod, tmp_path_factory) -> str:
         d = tmp_path_factory.mktemp("preview_fp")
-        return json.loads(video_mod._fingerprint_bytes(d, profile="preview"))
+        return json.loads(video_mod._fingerprint_bytes(d, profile="preview"))["mp4_sha256"]
 
     @pytest.fixture(scope="class")
-    def high_fp(self, video_mod, tmp_path_factory):
+    def high_mp4_hash(self, video_mod, tmp_path_factory) -> str:
         d = tmp_path_factory.mktemp("high_fp")
-        return json.loads(video_mod._fingerprint_bytes(d, profile="high"))
+        return json.loads(video_mod._fingerprint_bytes(d, profile="high"))["mp4_sha256"]
 
-    def test_default_mp4_sha256_matches_pinned(self, default_fp):
+    def test_default_mp4_sha256_matches_pinned(self, default_mp4_hash):
         """T1: default invocation → pinned preview hash."""
-        assert default_fp["mp4_sha256"] == self._PINNED_PREVIEW
+        assert default_mp4_hash == self._PINNED_PREVIEW
 
-    def test_preview_mp4_sha256_matches_pinned(self, preview_fp):
+    def test_preview_mp4_sha256_matches_pinned(self, preview_mp4_hash):
         """T2: explicit --profile preview → same pinned hash."""
-        assert preview_fp["mp4_sha256"] == self._PINNED_PREVIEW
+        assert preview_mp4_hash == self._PINNED_PREVIEW
 
-    def test_high_mp4_sha256_matches_pinned(self, high_fp):
+    def test_high_mp4_sha256_matches_pinned(self, high_mp4_hash):
         """T3: --profile high → pinned high hash."""
-        assert high_fp["mp4_sha256"] == self._PINNED_HIGH
+        assert high_mp4_hash == self._PINNED_HIGH
 
-    def test_default_equals_preview(self, default_fp, preview_fp):
+    def test_default_equals_preview(self, default_mp4_hash, preview_mp4_hash):
         """default == --profile preview (hash identity)."""
-        assert default_fp["mp4_sha256"] == preview_fp["mp4_sha256"]
+        assert default_mp4_hash == preview_mp4_hash
 
 
 @pytest.mark.slow
+@pytest.mark.xdist_group("audit_render_high")
+@pytest.mark.usefixtures("require_ffmpeg")
 class TestVideoAuditRenderHighProfile:
     """T4 for high profile: audit-render proves RenderOutput.json + fingerprint are stable."""
 
-    @pytest.fixture(autouse=True)
-    def _need_ffmpeg(self, require_ffmpeg): ...
+    @pytest.fixture(scope="class")
+    def high_fixture_files(self, verify_fixture_files):
+        return verify_fixture_files["high"]
 
     @pytest.fixture(scope="class")
-    def high_fixture_files(self, tmp_path_factory):
-        try:
-            from PIL import Image  # noqa: F401
-        except ImportError:
-            pytest.skip("Pillow not installed")
-        import sys; sys.path.insert(0, str(VIDEO_SCRIPT.parents[1] / "tools"))
-        from tests._fixture_builders import build_minimal_verify_fixture
-        manifest, plan = build_minimal_verify_fixture(profile="high")
-        d = tmp_path_factory.mktemp("audit_high")
-        manifest_path = d / "asset_manifest.json"
-        plan_path     = d / "render_plan.json"
-        manifest_path.write_text(manifest.model_dump_json(indent=2))
-        plan_path.write_text(plan.model_dump_json(indent=2))
-        return manifest_path, plan_path
-
-    def test_audit_high_exits_zero(self, high_fixture_files):
+    def high_audit_run(self, video_main, high_fixture_files):
+        """One `audit-render` run shared by the exit-code and stdout tests."""
         manifest_path, plan_path = high_fixture_files
-        result = subprocess.run(
-            [sys.executable, str(VIDEO_SCRIPT), "audit-render",
-             str(plan_path), str(manifest_path)],
-            capture_output=True, text=True,
-        )
-        assert result.returncode == 0, result.stderr
+        return video_main("audit-render", str(plan_path), str(manifest_path))
 
-    def test_audit_high_status_pass(self, high_fixture_files):
+    @pytest.fixture(scope="class")
+    def high_audit_dry_run(self, video_main, high_fixture_files):
+        """One `audit-render --dry-run` run shared by the exit-code and stdout tests."""
         manifest_path, plan_path = high_fixture_files
-        result = subprocess.run(
-            [sys.executable, str(VIDEO_SCRIPT), "audit-render",
-             str(plan_path), str(manifest_path)],
-            capture_output=True, text=True,
-        )
+        return video_main("audit-render", str(plan_path), str(manifest_path), "--dry-run")
+
+    def test_audit_high_exits_zero(self, high_audit_run):
+        result = high_audit_run
+        assert result.returncode == 0, result.stderr
+
+    def test_audit_high_status_pass(self, high_audit_run):
+        result = high_audit_run
         data = json.loads(result.stdout)
         assert data["status"] == "pass"
         assert data["diff_fields"] == []
 
-    def test_audit_high_dry_run_exits_zero(self, high_fixture_files):
-        manifest_path, plan_path = high_fixture_files
-        result = subprocess.run(
-            [sys.executable, str(VIDEO_SCRIPT), "audit-render",
-             str(plan_path), str(manifest_path), "--dry-run"],
-            capture_output=True, text=True,
-        )
+    def test_audit_high_dry_run_exits_zero(self, high_audit_dry_run):
+        result = high_audit_dry_run
         assert result.returncode == 0, result.stderr
 
-    def test_audit_high_dry_run_status_pass(self, high_fixture_files):
-        manifest_path, plan_path = high_fixture_files
-        result = subprocess.run(
-            [sys.executable, str(VIDEO_SCRIPT), "audit-render",
-             str(plan_path), str(manifest_path), "--dry-run"],
-            capture_output=True, text=True,
-        )
+    def test_audit_high_dry_run_status_pass(self, high_audit_dry_run):
+        result = high_audit_dry_run
         data = json.loads(result.stdout)
         assert data["status"] == "pass"
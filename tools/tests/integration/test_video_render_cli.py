@@ -10,19 +10,20 @@ Covers the behaviours that are NOT exercised by test_render_cli_smoke.py
   - Stdout is valid RenderOutput JSON with correct hash integrity
   - Missing required flags exit non-zero
 
-Marked @pytest.mark.slow (requires ffmpeg).
+Render classes are marked @pytest.mark.slow (requires ffmpeg); the
+argument-validation tests run in-process and do not need it.
 """
 from __future__ import annotations
 
 import hashlib
 import json
-import subprocess
-import sys
 from pathlib import Path
 
 import pytest
 
-VIDEO_SCRIPT = Path(__file__).resolve().parents[3] / "scripts" / "video.py"
+
+# SHA-256 of b"" (what an SRT with no cues hashes to).
+_EMPTY_SHA256 = "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855"
 
 
 # ---------------------------------------------------------------------------
@@ -30,39 +31,90 @@ VIDEO_SCRIPT = Path(__file__).resolve().parents[3] / "scripts" / "video.py"
 # ---------------------------------------------------------------------------
 
 def _sha256_file(path: Path) -> str:
-    h = hashlib.sha256()
     with open(path, "rb") as fh:
-        for chunk in iter(lambda: fh.read(65_536), b""):
-            h.update(chunk)
-    return h.hexdigest()
+        return hashlib.file_digest(fh, "sha256").hexdigest()
 
 
-def _sha256_text(text: str) -> str:
-    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+def _sha256_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
 
 
 # ---------------------------------------------------------------------------
-# Shared fixture: write native-format manifest + plan to disk
+# Session-scoped CLI runs — all three scenarios run in-process in one go via
+# video_main (conftest.py); outputs are read-only and shared by every test.
 # ---------------------------------------------------------------------------
 
-@pytest.fixture(scope="module")
-def render_fixture_files(tmp_path_factory):
-    """Write the minimal verify fixture (native Pydantic format) to disk."""
-    try:
-        from PIL import Image  # noqa: F401
-    except ImportError:
-        pytest.skip("Pillow not installed")
+def _render_argv(manifest_path: Path, plan_path: Path, out_dir: Path, *extra: str) -> list[str]:
+    return [
+        "render",
+        "--manifest", str(manifest_path),
+        "--plan",     str(plan_path),
+        "--out",      str(out_dir / "RenderOutput.json"),
+        *extra,
+    ]
+
+
+@pytest.fixture(scope="session")
+def all_render_outs(require_ffmpeg, tmp_path_factory, render_fixture_files, video_main) -> dict:
+    """
+    Run the explicit-paths, srt-default and dry-run renders and return
+    {"explicit": ..., "srt_default": ..., "dry_run": ...}.
+    """
+    manifest_path, plan_path = render_fixture_files
+    root = tmp_path_factory.mktemp("render_cli_out")
+    explicit_dir, srt_default_dir, dry_run_dir = (
+        root / "explicit", root / "srt_default", root / "dry_run"
+    )
+    scenarios = {
+        "explicit": (explicit_dir, (
+            "--video", str(explicit_dir / "output.mp4"),
+            "--srt",   str(explicit_dir / "output.srt"),
+        )),
+        "srt_default": (srt_default_dir, (
+            # --srt intentionally omitted
+            "--video", str(srt_default_dir / "myvideo.mp4"),
+        )),
+        "dry_run": (dry_run_dir, (
+            "--video", str(dry_run_dir / "output.mp4"),
+            "--dry-run",
+        )),
+    }
+
+    outs = {}
+    for name, (out_dir, extra) in scenarios.items():
+        out_dir.mkdir()
+        result = video_main(*_render_argv(manifest_path, plan_path, out_dir, *extra))
+        assert result.returncode == 0, (
+            f"video render ({name}) exited {result.returncode}:\n"
+            f"STDOUT:\n{result.stdout}\nSTDERR:\n{result.stderr}"
+        )
+        outs[name] = {"out_dir": out_dir, "stdout": result.stdout}
+    outs["srt_default"]["video_path"] = srt_default_dir / "myvideo.mp4"
+    return outs
+
+
+@pytest.fixture(scope="session")
+def explicit_render_out(all_render_outs) -> dict:
+    """video render with --out / --video / --srt as distinct explicit paths."""
+    return all_render_outs["explicit"]
+
+
+@pytest.fixture(scope="session")
+def render_output_json(explicit_render_out) -> dict:
+    """RenderOutput.json from the explicit-paths run, read and parsed once."""
+    return json.loads((explicit_render_out["out_dir"] / "RenderOutput.json").read_bytes())
 
-    sys.path.insert(0, str(VIDEO_SCRIPT.parents[1] / "tools"))
-    from tests._fixture_builders import build_minimal_verify_fixture
 
-    manifest, plan = build_minimal_verify_fixture()
-    d = tmp_path_factory.mktemp("render_cli_fixtures")
-    manifest_path = d / "AssetManifest.json"
-    plan_path = d / "RenderPlan.json"
-    manifest_path.write_text(manifest.model_dump_json(indent=2), encoding="utf-8")
-    plan_path.write_text(plan.model_dump_json(indent=2), encoding="utf-8")
-    return manifest_path, plan_path
+@pytest.fixture(scope="session")
+def srt_default_render_out(all_render_outs) -> dict:
+    """video render with --srt omitted."""
+    return all_render_outs["srt_default"]
+
+
+@pytest.fixture(scope="session")
+def dry_run_out(all_render_outs) -> dict:
+    """video render --dry-run."""
+    return all_render_outs["dry_run"]
 
 
 # ---------------------------------------------------------------------------
@@ -70,66 +122,41 @@ def render_fixture_files(tmp_path_factory):
 # ---------------------------------------------------------------------------
 
 @pytest.mark.slow
+@pytest.mark.xdist_group("video_render")
+@pytest.mark.usefixtures("require_ffmpeg")
 class TestVideoRenderExplicitPaths:
     """video render with --out / --video / --srt as distinct explicit paths."""
 
-    @pytest.fixture(autouse=True)
-    def _need_ffmpeg(self, require_ffmpeg): ...
-
-    @pytest.fixture(scope="class")
-    def render_out(self, tmp_path_factory, render_fixture_files):
-        manifest_path, plan_path = render_fixture_files
-        out_dir = tmp_path_factory.mktemp("render_explicit_out")
-        result = subprocess.run(
-            [
-                sys.executable, str(VIDEO_SCRIPT), "render",
-                "--manifest", str(manifest_path),
-                "--plan",     str(plan_path),
-                "--out",      str(out_dir / "RenderOutput.json"),
-                "--video",    str(out_dir / "output.mp4"),
-                "--srt",      str(out_dir / "output.srt"),
-            ],
-            capture_output=True,
-            text=True,
-        )
-        assert result.returncode == 0, (
-            f"video render exited {result.returncode}:\n"
-            f"STDOUT:\n{result.stdout}\nSTDERR:\n{result.stderr}"
-        )
-        return {"out_dir": out_dir, "stdout": result.stdout}
-
-    def test_render_output_json_at_out_path(self, render_out):
-        assert (render_out["out_dir"] / "RenderOutput.json").exists()
+    def test_render_output_json_at_out_path(self, explicit_render_out):
+        assert (explicit_render_out["out_dir"] / "RenderOutput.json").exists()
 
-    def test_mp4_at_video_path(self, render_out):
-        assert (render_out["out_dir"] / "output.mp4").exists()
+    def test_mp4_at_video_path(self, explicit_render_out):
+        assert (explicit_render_out["out_dir"] / "output.mp4").exists()
 
-    def test_srt_at_srt_path(self, render_out):
-        assert (render_out["out_dir"] / "output.srt").exists()
+    def test_srt_at_srt_path(self, explicit_render_out):
+        assert (explicit_render_out["out_dir"] / "output.srt").exists()
 
-    def test_stdout_is_valid_render_output_json(self, render_out):
-        data = json.loads(render_out["stdout"])
+    def test_stdout_is_valid_render_output_json(self, explicit_render_out):
+        data = json.loads(explicit_render_out["stdout"])
         assert data["schema_version"] == "0.0.1"
         assert "output_id" in data
         assert "hashes" in data
 
-    def test_video_sha256_matches_file(self, render_out):
-        data = json.loads((render_out["out_dir"] / "RenderOutput.json").read_text())
-        actual = _sha256_file(render_out["out_dir"] / "output.mp4")
-        assert data["hashes"]["video_sha256"] == actual
+    def test_video_sha256_matches_file(self, explicit_render_out, render_output_json):
+        actual = _sha256_file(explicit_render_out["out_dir"] / "output.mp4")
+        assert render_output_json["hashes"]["video_sha256"] == actual
 
-    def test_captions_sha256_matches_file(self, render_out):
-        data = json.loads((render_out["out_dir"] / "RenderOutput.json").read_text())
-        actual = _sha256_text(
-            (render_out["out_dir"] / "output.srt").read_text(encoding="utf-8")
-        )
-        assert data["hashes"]["captions_sha256"] == actual
+    def test_captions_sha256_matches_file(self, explicit_render_out, render_output_json):
+        srt = (explicit_render_out["out_dir"] / "output.srt").read_bytes()
+        # The minimal fixture has no VO lines, so the SRT is normally empty.
+        actual = _EMPTY_SHA256 if not srt else _sha256_bytes(srt)
+        assert render_output_json["hashes"]["captions_sha256"] == actual
 
-    def test_render_output_written_to_out_not_out_dir(self, render_out):
+    def test_render_output_written_to_out_not_out_dir(self, explicit_render_out):
         """RenderOutput.json must be at --out, not at a default location."""
-        assert (render_out["out_dir"] / "RenderOutput.json").exists()
+        assert (explicit_render_out["out_dir"] / "RenderOutput.json").exists()
         # Ensure no stray render_output.json landed elsewhere
-        assert not (render_out["out_dir"] / "render_output.json").exists()
+        assert not (explicit_render_out["out_dir"] / "render_output.json").exists()
 
 
 # ---------------------------------------------------------------------------
@@ -137,36 +164,13 @@ class TestVideoRenderExplicitPaths:
 # ---------------------------------------------------------------------------
 
 @pytest.mark.slow
+@pytest.mark.xdist_group("video_render")
+@pytest.mark.usefixtures("require_ffmpeg")
 class TestVideoRenderSrtDefault:
     """--srt omitted → srt lands at video_path.with_suffix('.srt')."""
 
-    @pytest.fixture(autouse=True)
-    def _need_ffmpeg(self, require_ffmpeg): ...
-
-    @pytest.fixture(scope="class")
-    def render_out(self, tmp_path_factory, render_fixture_files):
-        manifest_path, plan_path = render_fixture_files
-        out_dir = tmp_path_factory.mktemp("render_srt_default")
-        video_path = out_dir / "myvideo.mp4"
-        result = subprocess.run(
-            [
-                sys.executable, str(VIDEO_SCRIPT), "render",
-                "--manifest", str(manifest_path),
-                "--plan",     str(plan_path),
-                "--out",      str(out_dir / "RenderOutput.json"),
-                "--video",    str(video_path),
-                # --srt intentionally omitted
-            ],
-            capture_output=True,
-            text=True,
-        )
-        assert result.returncode == 0, (
-            f"video render exited {result.returncode}:\n{result.stderr}"
-        )
-        return {"out_dir": out_dir, "video_path": video_path}
-
-    def test_srt_next_to_video(self, render_out):
-        expected_srt = render_out["video_path"].with_suffix(".srt")
+    def test_srt_next_to_video(self, srt_default_render_out):
+        expected_srt = srt_default_render_out["video_path"].with_suffix(".srt")
         assert expected_srt.exists(), f"Expected SRT at {expected_srt}"
 
 
@@ -175,33 +179,11 @@ class TestVideoRenderSrtDefault:
 # ---------------------------------------------------------------------------
 
 @pytest.mark.slow
+@pytest.mark.xdist_group("video_render")
+@pytest.mark.usefixtures("require_ffmpeg")
 class TestVideoRenderDryRun:
     """--dry-run writes RenderOutput.json but must not produce mp4 or srt."""
 
-    @pytest.fixture(autouse=True)
-    def _need_ffmpeg(self, require_ffmpeg): ...
-
-    @pytest.fixture(scope="class")
-    def dry_run_out(self, tmp_path_factory, render_fixture_files):
-        manifest_path, plan_path = render_fixture_files
-        out_dir = tmp_path_factory.mktemp("render_dry_run")
-        result = subprocess.run(
-            [
-                sys.executable, str(VIDEO_SCRIPT), "render",
-                "--manifest", str(manifest_path),
-                "--plan",     str(plan_path),
-                "--out",      str(out_dir / "RenderOutput.json"),
-                "--video",    str(out_dir / "output.mp4"),
-                "--dry-run",
-            ],
-            capture_output=True,
-            text=True,
-        )
-        assert result.returncode == 0, (
-            f"video render --dry-run exited {result.returncode}:\n{result.stderr}"
-        )
-        return {"out_dir": out_dir, "stdout": result.stdout}
-
     def test_render_output_json_written(self, dry_run_out):
         assert (dry_run_out["out_dir"] / "RenderOutput.json").exists()
 
@@ -222,66 +204,31 @@ class TestVideoRenderDryRun:
 # Argument validation: missing required flags exit non-zero
 # ---------------------------------------------------------------------------
 
-@pytest.mark.slow
+# "{tmp}" in a token is replaced with the test's tmp_path.
+_ARG_CASES = {
+    "missing_manifest": (
+        "--plan", "{tmp}/plan.json", "--out", "{tmp}/out.json", "--video", "{tmp}/out.mp4",
+    ),
+    "missing_plan": (
+        "--manifest", "{tmp}/manifest.json", "--out", "{tmp}/out.json", "--video", "{tmp}/out.mp4",
+    ),
+    "missing_out": (
+        "--manifest", "{tmp}/manifest.json", "--plan", "{tmp}/plan.json", "--video", "{tmp}/out.mp4",
+    ),
+    "missing_video": (
+        "--manifest", "{tmp}/manifest.json", "--plan", "{tmp}/plan.json", "--out", "{tmp}/out.json",
+    ),
+    "nonexistent_manifest": (
+        "--manifest", "{tmp}/no_such.json", "--plan", "{tmp}/no_such_plan.json",
+        "--out", "{tmp}/out.json", "--video", "{tmp}/out.mp4",
+    ),
+}
+
+
 class TestVideoRenderArgValidation:
+    """In-process: argparse / input loading fail before any ffmpeg call."""
 
-    def test_missing_manifest_exits_nonzero(self, tmp_path):
-        result = subprocess.run(
-            [
-                sys.executable, str(VIDEO_SCRIPT), "render",
-                "--plan",  str(tmp_path / "plan.json"),
-                "--out",   str(tmp_path / "out.json"),
-                "--video", str(tmp_path / "out.mp4"),
-            ],
-            capture_output=True, text=True,
-        )
-        assert result.returncode != 0
-
-    def test_missing_plan_exits_nonzero(self, tmp_path):
-        result = subprocess.run(
-            [
-                sys.executable, str(VIDEO_SCRIPT), "render",
-                "--manifest", str(tmp_path / "manifest.json"),
-                "--out",      str(tmp_path / "out.json"),
-                "--video",    str(tmp_path / "out.mp4"),
-            ],
-            capture_output=True, text=True,
-        )
-        assert result.returncode != 0
-
-    def test_missing_out_exits_nonzero(self, tmp_path):
-        result = subprocess.run(
-            [
-                sys.executable, str(VIDEO_SCRIPT), "render",
-                "--manifest", str(tmp_path / "manifest.json"),
-                "--plan",     str(tmp_path / "plan.json"),
-                "--video",    str(tmp_path / "out.mp4"),
-            ],
-            capture_output=True, text=True,
-        )
-        assert result.returncode != 0
-
-    def test_missing_video_exits_nonzero(self, tmp_path):
-        result = subprocess.run(
-            [
-                sys.executable, str(VIDEO_SCRIPT), "render",
-                "--manifest", str(tmp_path / "manifest.json"),
-                "--plan",     str(tmp_path / "plan.json"),
-                "--out",      str(tmp_path / "out.json"),
-            ],
-            capture_output=True, text=True,
-        )
-        assert result.returncode != 0
-
-    def test_nonexistent_manifest_exits_nonzero(self, tmp_path):
-        result = subprocess.run(
-            [
-                sys.executable, str(VIDEO_SCRIPT), "render",
-                "--manifest", str(tmp_path / "no_such.json"),
-                "--plan",     str(tmp_path / "no_such_plan.json"),
-                "--out",      str(tmp_path / "out.json"),
-                "--video",    str(tmp_path / "out.mp4"),
-            ],
-            capture_output=True, text=True,
-        )
-        assert result.returncode != 0
+    @pytest.mark.parametrize("case", sorted(_ARG_CASES))
+    def test_exits_nonzero(self, tmp_path, video_main, case):
+        argv = [tok.replace("{tmp}", str(tmp_path)) for tok in _ARG_CASES[case]]
+        assert video_main("render", *argv).returncode != 0
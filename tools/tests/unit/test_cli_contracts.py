@@ -0,0 +1,68 @@
+"""
+Unit tests for tools/cli.py contract validation helpers.
+
+Tests:
+  - contract_validator compiles each schema file once per version (path + mtime)
+  - an edited schema file is recompiled
+  - unmapped schema ids have no validator and pass _validate_contract
+  - _validate_contract exits 1 and lists at most _MAX_CONTRACT_ERRORS messages
+
+No ffmpeg required.
+"""
+from __future__ import annotations
+
+import os
+import shutil
+
+import pytest
+
+import cli
+from cli import _MAX_CONTRACT_ERRORS, _validate_contract, contract_validator
+from verify_contracts import CONTRACTS_DIR
+
+_SCHEMAS_DIR = CONTRACTS_DIR / "schemas"
+
+
+@pytest.fixture
+def fresh_cache():
+    """Run with an empty compiled-validator cache; returns its cache_info()."""
+    cli._compile_contract.cache_clear()
+    yield cli._compile_contract.cache_info
+    cli._compile_contract.cache_clear()
+
+
+class TestContractValidator:
+
+    def test_compiles_each_schema_once(self, fresh_cache):
+        validators = {id(contract_validator("RenderPlan", _SCHEMAS_DIR)) for _ in range(3)}
+        assert len(validators) == 1
+        assert fresh_cache().misses == 1
+
+    def test_recompiles_edited_schema(self, tmp_path, fresh_cache):
+        schema = tmp_path / "RenderPlan.v1.json"
+        shutil.copyfile(_SCHEMAS_DIR / "RenderPlan.v1.json", schema)
+        assert not contract_validator("RenderPlan", tmp_path).is_valid({})
+
+        schema.write_text('{"type": "object"}', encoding="utf-8")
+        st = schema.stat()
+        os.utime(schema, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert contract_validator("RenderPlan", tmp_path).is_valid({})
+        assert fresh_cache().misses == 2
+
+    def test_unmapped_schema_id_has_no_validator(self):
+        assert contract_validator("NotAContract", _SCHEMAS_DIR) is None
+
+
+class TestValidateContract:
+
+    def test_unmapped_schema_id_passes(self):
+        _validate_contract({"schema_id": "NotAContract"}, "thing")
+
+    def test_invalid_data_exits_with_capped_messages(self, capsys):
+        # {} misses more required RenderPlan fields than are reported.
+        with pytest.raises(SystemExit) as exc:
+            _validate_contract({"schema_id": "RenderPlan"}, "render plan")
+        assert exc.value.code == 1
+        lines = capsys.readouterr().err.splitlines()
+        assert lines[0].startswith("Contract validation FAILED for render plan")
+        assert len(lines) == 1 + _MAX_CONTRACT_ERRORS
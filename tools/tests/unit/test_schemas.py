@@ -16,12 +16,14 @@ No ffmpeg required.
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from pathlib import Path
 
 import pytest
 from pydantic import ValidationError
 
-from verify_contracts import check_schema, CONTRACTS_DIR as _CONTRACTS_DIR
+from cli import contract_validator
+from verify_contracts import CONTRACTS_DIR as _CONTRACTS_DIR
 
 _SCHEMAS_DIR = _CONTRACTS_DIR / "schemas"
 _GOLDENS_DIR = _CONTRACTS_DIR / "goldens"
@@ -29,6 +31,8 @@ _GOLDENS_DIR = _CONTRACTS_DIR / "goldens"
 from schemas.asset_manifest import AssetManifest, Shot, VisualAsset, VOLine, SFXItem
 from schemas.render_plan import FallbackConfig, RenderPlan, Resolution
 from schemas.render_output import Lineage, OutputHashes, Producer, Provenance, RenderFingerprint, RenderOutput
+from schemas.base import canonical_json_bytes
+from renderer.preview_local import _canonical_json_hash
 
 
 # ===========================================================================
@@ -54,53 +58,32 @@ class TestAssetManifest:
 
     def test_roundtrip_json(self):
         """Serialise and re-parse produces an identical model."""
-        m = AssetManifest(
-            manifest_id="m-rt",
-            project_id="p",
-            shotlist_ref="file:///sl.json",
-            timing_lock_hash="sha256:rt",
-            shots=[
-                Shot(
-                    shot_id="s1",
-                    duration_ms=3000,
-                    visual_assets=[
-                        VisualAsset(asset_id="bg1", role="background",
-                                    asset_uri="file:///bg.png")
+        # Nested shots as plain dicts: one validator pass over the whole tree.
+        m = AssetManifest.model_validate({
+            "manifest_id": "m-rt",
+            "project_id": "p",
+            "shotlist_ref": "file:///sl.json",
+            "timing_lock_hash": "sha256:rt",
+            "shots": [
+                {
+                    "shot_id": "s1",
+                    "duration_ms": 3000,
+                    "visual_assets": [
+                        {"asset_id": "bg1", "role": "background",
+                         "asset_uri": "file:///bg.png"},
                     ],
-                    vo_lines=[
-                        VOLine(line_id="v1", speaker_id="narrator",
-                               text="Hello", timeline_in_ms=0, timeline_out_ms=2000)
+                    "vo_lines": [
+                        {"line_id": "v1", "speaker_id": "narrator",
+                         "text": "Hello", "timeline_in_ms": 0, "timeline_out_ms": 2000},
                     ],
-                )
+                }
             ],
-            music_uri="file:///music.mp3",
-        )
+            "music_uri": "file:///music.mp3",
+        })
         raw = m.model_dump_json()
         m2 = AssetManifest.model_validate_json(raw)
         assert m2 == m
 
-    def test_missing_manifest_id_raises(self):
-        with pytest.raises(ValidationError):
-            AssetManifest(  # type: ignore[call-arg]
-                project_id="p",
-                shotlist_ref="file:///sl.json",
-                timing_lock_hash="sha256:x",
-                shots=[],
-            )
-
-    def test_missing_timing_lock_hash_raises(self):
-        with pytest.raises(ValidationError):
-            AssetManifest(  # type: ignore[call-arg]
-                manifest_id="m",
-                project_id="p",
-                shotlist_ref="file:///sl.json",
-                shots=[],
-            )
-
-    def test_shot_duration_ms_required(self):
-        with pytest.raises(ValidationError):
-            Shot(shot_id="s1")  # type: ignore[call-arg]
-
     def test_visual_asset_null_uri_accepted(self):
         """asset_uri=None is valid (means placeholder needed)."""
         a = VisualAsset(asset_id="a1", role="character")
@@ -165,14 +148,6 @@ class TestRenderPlan:
         rp2 = RenderPlan.model_validate_json(rp.model_dump_json())
         assert rp2 == rp
 
-    def test_missing_timing_lock_hash_raises(self):
-        with pytest.raises(ValidationError):
-            RenderPlan(  # type: ignore[call-arg]
-                plan_id="p",
-                project_id="p",
-                asset_manifest_ref="file:///m.json",
-            )
-
     def test_resolution_defaults(self):
         r = Resolution()
         assert r.width == 1280
@@ -208,55 +183,144 @@ class TestRenderPlan:
             assert field in d, f"Missing canonical field: {field}"
 
 
+# ===========================================================================
+# Missing required fields
+# ===========================================================================
+
+_MISSING_REQUIRED = [
+    pytest.param(
+        AssetManifest,
+        dict(project_id="p", shotlist_ref="file:///sl.json",
+             timing_lock_hash="sha256:x", shots=[]),
+        id="asset_manifest-manifest_id",
+    ),
+    pytest.param(
+        AssetManifest,
+        dict(manifest_id="m", project_id="p", shotlist_ref="file:///sl.json", shots=[]),
+        id="asset_manifest-timing_lock_hash",
+    ),
+    pytest.param(Shot, dict(shot_id="s1"), id="shot-duration_ms"),
+    pytest.param(
+        RenderPlan,
+        dict(plan_id="p", project_id="p", asset_manifest_ref="file:///m.json"),
+        id="render_plan-timing_lock_hash",
+    ),
+]
+
+
+@pytest.mark.parametrize("model,payload", _MISSING_REQUIRED)
+def test_missing_required_field_raises(model, payload):
+    with pytest.raises(ValidationError):
+        model(**payload)
+
+
+# ===========================================================================
+# Unknown fields — tolerated at the CLI boundary
+# ===========================================================================
+
+_UNKNOWN_FIELD_CASES = [
+    pytest.param(
+        AssetManifest,
+        dict(manifest_id="m", project_id="p", shotlist_ref="file:///sl.json",
+             timing_lock_hash="sha256:x", orchestrator_run="r-1",
+             shots=[dict(shot_id="s1", duration_ms=1000, camera="wide")]),
+        id="asset_manifest",
+    ),
+    pytest.param(
+        RenderPlan,
+        dict(plan_id="p", project_id="p", asset_manifest_ref="file:///m.json",
+             timing_lock_hash="sha256:x", orchestrator_run="r-1"),
+        id="render_plan",
+    ),
+]
+
+
+@pytest.mark.parametrize("model,payload", _UNKNOWN_FIELD_CASES)
+def test_unknown_fields_ignored(model, payload):
+    """
+    Orchestrator-produced files may carry undeclared keys (RenderPlan.v1.json
+    allows additionalProperties).  model_validate, as used by cli.py and
+    render_from_orchestrator.py, drops them instead of raising.
+    """
+    m = model.model_validate(payload)
+    assert "orchestrator_run" not in m.model_dump()
+
+
 # ===========================================================================
 # RenderOutput — §5.9
 # ===========================================================================
 
-class TestRenderOutput:
+def _render_output(construct: bool = False) -> RenderOutput:
+    """
+    The shared RenderOutput fixture data.
 
-    def _make_valid(self) -> RenderOutput:
-        return RenderOutput(
-            output_id="out-001",
-            request_id="req-001",
-            render_plan_ref="file:///plan.json",
-            video_uri="file:///output.mp4",
-            captions_uri="file:///output.srt",
-            hashes=OutputHashes(
-                video_sha256="a" * 64,
-                captions_sha256="b" * 64,
-            ),
-            provenance=Provenance(
-                render_profile="preview_local",
-                timing_lock_hash="sha256:xyz",
-                rendered_at="2026-02-19T12:00:00Z",
-                ffmpeg_version="6.1.1",
-                placeholder_count=1,
-            ),
-            lineage=Lineage(
-                asset_manifest_hash="c" * 64,
-                render_plan_hash="d" * 64,
-            ),
-        )
+    construct=True builds the same tree with model_construct (no validation),
+    for tests that only read fields back.
+    """
+    def build(cls, **fields):
+        return cls.model_construct(**fields) if construct else cls(**fields)
+
+    return build(
+        RenderOutput,
+        output_id="out-001",
+        request_id="req-001",
+        render_plan_ref="file:///plan.json",
+        video_uri="file:///output.mp4",
+        captions_uri="file:///output.srt",
+        hashes=build(
+            OutputHashes,
+            video_sha256="a" * 64,
+            captions_sha256="b" * 64,
+        ),
+        provenance=build(
+            Provenance,
+            render_profile="preview_local",
+            timing_lock_hash="sha256:xyz",
+            rendered_at="2026-02-19T12:00:00Z",
+            ffmpeg_version="6.1.1",
+            placeholder_count=1,
+        ),
+        lineage=build(
+            Lineage,
+            asset_manifest_hash="c" * 64,
+            render_plan_hash="d" * 64,
+        ),
+    )
+
+
+@pytest.fixture(scope="module")
+def valid_render_output() -> RenderOutput:
+    """_render_output(), validated once and shared (read-only) per module."""
+    return _render_output()
+
+
+@pytest.fixture(scope="module")
+def fast_render_output() -> RenderOutput:
+    """_render_output(construct=True), built once and shared (read-only) per module."""
+    return _render_output(construct=True)
 
-    def test_valid(self):
-        ro = self._make_valid()
+
+class TestRenderOutput:
+
+    def test_valid(self, valid_render_output):
+        ro = valid_render_output
         assert ro.schema_version == "0.0.1"
         assert ro.schema_id == "RenderOutput"
         assert ro.producer.name == "PreviewRenderer"
         assert ro.producer.version == "0.0.1"
         assert ro.audio_stems_uri is None
 
-    def test_producer_defaults(self):
-        ro = self._make_valid()
+    def test_producer_defaults(self, valid_render_output):
+        ro = valid_render_output
         assert ro.producer.name == "PreviewRenderer"
         assert ro.producer.version == "0.0.1"
 
-    def test_schema_id_default(self):
-        ro = self._make_valid()
+    def test_schema_id_default(self, valid_render_output):
+        ro = valid_render_output
         assert ro.schema_id == "RenderOutput"
 
-    def test_roundtrip_json(self):
-        ro = self._make_valid()
+    def test_roundtrip_json(self, valid_render_output):
+        ro = valid_render_output
         ro2 = RenderOutput.model_validate_json(ro.model_dump_json())
         assert ro2 == ro
 
@@ -281,20 +345,20 @@ class TestRenderOutput:
         )
         assert ro.video_uri is None
 
-    def test_canonical_field_names(self):
+    def test_canonical_field_names(self, fast_render_output):
         """§5.9 canonical field names are present."""
-        ro = self._make_valid()
+        ro = fast_render_output
         d = ro.model_dump()
         for field in ("video_uri", "captions_uri", "audio_stems_uri",
                       "hashes", "provenance", "lineage"):
             assert field in d, f"Missing canonical field: {field}"
 
-    def test_audio_stems_optional(self):
+    def test_audio_stems_optional(self, valid_render_output):
         """audio_stems_uri is optional (null in Phase 0)."""
-        ro = self._make_valid()
+        ro = valid_render_output
         assert ro.audio_stems_uri is None
         # Also accept explicit null in JSON
-        j = json.loads(ro.model_dump_json())
+        j = ro.model_dump(mode="json")
         j["audio_stems_uri"] = None
         ro2 = RenderOutput.model_validate(j)
         assert ro2.audio_stems_uri is None
@@ -304,66 +368,88 @@ class TestRenderOutput:
 # Canonical JSON hashing — determinism contract
 # ===========================================================================
 
+def _manifest(manifest_id: str = "m-001") -> AssetManifest:
+    # model_construct: trusted data, and these tests only hash the dump.
+    return AssetManifest.model_construct(
+        manifest_id=manifest_id,
+        project_id="proj-1",
+        shotlist_ref="file:///shotlist.json",
+        timing_lock_hash="sha256:abc",
+        shots=[Shot.model_construct(shot_id="s1", duration_ms=2000)],
+    )
+
+
+@pytest.fixture(scope="module")
+def minimal_manifest() -> AssetManifest:
+    """_manifest(), built once and shared (read-only) per module."""
+    return _manifest()
+
+
 class TestCanonicalJsonHash:
     """
     _canonical_json_hash must return the same digest for the same object on
     every call, regardless of Python dict insertion order or Pydantic version.
     """
 
-    def _manifest(self, manifest_id: str = "m-001") -> AssetManifest:
-        return AssetManifest(
-            manifest_id=manifest_id,
-            project_id="proj-1",
-            shotlist_ref="file:///shotlist.json",
-            timing_lock_hash="sha256:abc",
-            shots=[Shot(shot_id="s1", duration_ms=2000)],
-        )
-
-    def test_same_object_same_hash_repeated(self):
+    def test_same_object_same_hash_repeated(self, minimal_manifest):
         """The same AssetManifest always produces the same canonical hash."""
-        from renderer.preview_local import _canonical_json_hash
-
-        m = self._manifest()
-        hashes = [_canonical_json_hash(m.model_dump()) for _ in range(5)]
-        assert len(set(hashes)) == 1, (
-            f"_canonical_json_hash is not stable: got {set(hashes)}"
-        )
+        m = minimal_manifest
+        first = _canonical_json_hash(m.model_dump())
+        for _ in range(4):
+            h = _canonical_json_hash(m.model_dump())
+            assert h == first, f"_canonical_json_hash is not stable: {first} != {h}"
 
     def test_same_plan_same_hash_repeated(self):
         """The same RenderPlan always produces the same canonical hash."""
-        from renderer.preview_local import _canonical_json_hash
-
         rp = RenderPlan(
             plan_id="p-001",
             project_id="proj-1",
             asset_manifest_ref="file:///manifest.json",
             timing_lock_hash="sha256:abc",
         )
-        hashes = [_canonical_json_hash(rp.model_dump()) for _ in range(5)]
-        assert len(set(hashes)) == 1, (
-            f"_canonical_json_hash is not stable: got {set(hashes)}"
-        )
+        first = _canonical_json_hash(rp.model_dump())
+        for _ in range(4):
+            h = _canonical_json_hash(rp.model_dump())
+            assert h == first, f"_canonical_json_hash is not stable: {first} != {h}"
 
     def test_distinct_objects_distinct_hashes(self):
         """Two manifests that differ in any field must produce different hashes."""
-        from renderer.preview_local import _canonical_json_hash
-
-        h1 = _canonical_json_hash(self._manifest("m-aaa").model_dump())
-        h2 = _canonical_json_hash(self._manifest("m-bbb").model_dump())
+        h1 = _canonical_json_hash(_manifest("m-aaa").model_dump())
+        h2 = _canonical_json_hash(_manifest("m-bbb").model_dump())
         assert h1 != h2
 
-    def test_canonical_json_is_sorted_keys(self):
+    def test_canonical_json_is_sorted_keys(self, minimal_manifest):
         """canonical JSON must have sorted keys (contract for cross-language interop)."""
-        from renderer.preview_local import _canonical_json_hash
-
-        # Build the canonical string directly and check key order.
-        m = self._manifest()
-        d = m.model_dump()
-        canonical = json.dumps(d, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
-        parsed_keys = list(json.loads(canonical).keys())
-        assert parsed_keys == sorted(parsed_keys), (
-            "Top-level keys are not sorted in canonical JSON output."
+        # Check the bytes that are actually hashed, at every nesting level, in
+        # a single parse (object_pairs_hook sees keys in emitted order).
+        key_orders: list[list[str]] = []
+        json.loads(
+            minimal_manifest.canonical_json,
+            object_pairs_hook=lambda pairs: key_orders.append([k for k, _ in pairs]) or dict(pairs),
         )
+        assert key_orders
+        for keys in key_orders:
+            assert keys == sorted(keys), f"Keys not sorted in canonical JSON output: {keys}"
+
+    def test_cached_canonical_sha256_matches_helper(self, minimal_manifest):
+        """canonical_sha256 on the model is byte-identical to _canonical_json_hash."""
+        m = minimal_manifest
+        assert m.canonical_sha256 == _canonical_json_hash(m.model_dump())
+        assert m.canonical_sha256 is m.canonical_sha256  # cached on the instance
+
+        m2 = m.model_copy(update={"manifest_id": "m-other"})
+        assert m2.canonical_sha256 == _canonical_json_hash(m2.model_dump())
+        assert m2.canonical_sha256 != m.canonical_sha256
+
+    def test_cached_canonical_json_matches_helper(self, minimal_manifest):
+        """canonical_json is cached and dropped by model_copy()."""
+        m = minimal_manifest
+        assert m.canonical_json == canonical_json_bytes(m.model_dump())
+        assert m.canonical_json is m.canonical_json
+
+        m2 = m.model_copy(update={"manifest_id": "m-other"})
+        assert m2.canonical_json == canonical_json_bytes(m2.model_dump())
+        assert m2.canonical_json != m.canonical_json
 
 
 # ===========================================================================
@@ -372,11 +458,14 @@ class TestCanonicalJsonHash:
 
 class TestRenderFingerprint:
 
-    def _make_fp(self) -> RenderFingerprint:
-        return RenderFingerprint(
+    def _make_fp(self, construct: bool = False, **extra) -> RenderFingerprint:
+        """construct=True skips validation, for tests that only read fields."""
+        build = RenderFingerprint.model_construct if construct else RenderFingerprint
+        return build(
             inputs_digest="a" * 64,
             mp4_sha256="b" * 64,
             srt_sha256="c" * 64,
+            **extra,
         )
 
     def test_valid(self):
@@ -390,16 +479,13 @@ class TestRenderFingerprint:
         assert fp2 == fp
 
     def test_no_timestamp_fields(self):
-        fp = self._make_fp()
+        fp = self._make_fp(construct=True)
         d = fp.model_dump()
         for bad_key in ("rendered_at", "timestamp", "created_at"):
             assert bad_key not in d
 
     def test_frame_hashes_list(self):
-        fp = RenderFingerprint(
-            inputs_digest="a" * 64, mp4_sha256="b" * 64, srt_sha256="c" * 64,
-            frame_hashes=["hash1", "hash2"],
-        )
+        fp = self._make_fp(construct=True, frame_hashes=["hash1", "hash2"])
         assert fp.frame_hashes == ["hash1", "hash2"]
 
 
@@ -419,14 +505,18 @@ class TestContractSchemaCompliance:
     # ------------------------------------------------------------------
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def _load_golden(suite: str, filename: str) -> dict:
+        # Goldens are immutable for the run and only read by _assert_valid, so
+        # every caller shares the one parsed dict — do not mutate it.
         path = _GOLDENS_DIR / suite / filename
-        return json.loads(path.read_text(encoding="utf-8"))
+        return json.loads(path.read_bytes())
 
     @staticmethod
     def _assert_valid(data: dict, schema_id: str) -> None:
-        errors = check_schema(data, schema_id, _SCHEMAS_DIR)
-        assert errors == [], f"Contract violations for {schema_id!r}:\n" + "\n".join(errors)
+        # Cached validator; stop at the first violation.
+        first = next(contract_validator(schema_id, _SCHEMAS_DIR).iter_errors(data), None)
+        assert first is None, f"Contract violation for {schema_id!r}: {first.message}"
 
     # ------------------------------------------------------------------
     # Golden fixture → schema
@@ -486,5 +576,5 @@ class TestContractSchemaCompliance:
                 render_plan_hash="e" * 64,
             ),
         )
-        data = json.loads(ro.model_dump_json())
+        data = ro.model_dump(mode="json")
         self._assert_valid(data, "RenderOutput")